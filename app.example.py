@@ -75,7 +75,13 @@ if CUSTATEVEC_AVAILABLE:
 # Create Application
 # ==============================================================================
 
-app = create_app(executors=executors)
+app = create_app(
+    executors=executors,
+    # Finished jobs and their results are evicted after this many seconds, or
+    # once more than max_finished_jobs have finished (oldest first)
+    finished_job_ttl=3600.0,
+    max_finished_jobs=10_000,
+)
 
 # The 'app' object is used by uvicorn:
 #   uv run uvicorn app:app --host 0.0.0.0 --port 8000
@@ -25,16 +25,33 @@ WARNING: These utilities bypass IBM Cloud authentication and should only be used
 for local development and testing with self-hosted servers.
 """
 
+import functools
+import re
 from contextlib import contextmanager
 from typing import Any
-from unittest.mock import patch
 
 from qiskit import qpy
 from qiskit_ibm_runtime import QiskitRuntimeService
+from qiskit_ibm_runtime.accounts.account import CloudAccount
+from qiskit_ibm_runtime.api.auth import CloudAuth
+from qiskit_ibm_runtime.api.clients.runtime import RuntimeClient
+from qiskit_ibm_runtime.utils import json as runtime_json
 
 COMPATIBLE_QPY_VERSION = 13
 
+# IBM Cloud endpoints should use original authentication
+_IBM_CLOUD_RE = re.compile(
+    r"cloud\.ibm\.com|quantum-computing\.ibm\.com|quantum\.ibm\.com", re.IGNORECASE
+)
 
+# Backend list/configuration responses keyed by (API base URL, backend name).
+# A local server returns the same data for the lifetime of a connection, so
+# nested or repeated lookups are served from here instead of over HTTP.
+# The backend list is stored under the name None.
+_backend_cache: dict[tuple[str, str | None], Any] = {}
+
+
+@functools.lru_cache(maxsize=128)
 def _is_local_or_custom_server(url: str) -> bool:
     """Check if URL points to local/custom server (not IBM Cloud).
 
@@ -56,22 +73,66 @@ def _is_local_or_custom_server(url: str) -> bool:
     if not url:
         return False
 
-    url_lower = url.lower()
-
-    # IBM Cloud endpoints should use original authentication
-    ibm_cloud_domains = [
-        "cloud.ibm.com",
-        "quantum-computing.ibm.com",
-        "quantum.ibm.com",
-    ]
-
     # Return True if NOT an IBM Cloud domain
     # This includes all local/custom servers:
     # - localhost, 127.0.0.1
     # - Private IPs (192.168.x.x, 10.x.x.x, 172.16-31.x.x)
     # - Custom domains (quantum.local, my-server.dev, etc.)
     # - LAN servers (http://192.168.1.100:8000)
-    return not any(domain in url_lower for domain in ibm_cloud_domains)
+    return _IBM_CLOUD_RE.search(url) is None
+
+
+def _patched_cloudauth_init(self, api_key, crn, private=False, proxies=None, verify=True) -> None:
+    """Skip IAM setup for localhost testing."""
+    self.crn = crn
+    self.api_key = api_key
+    self.private = private
+    self.proxies = proxies
+    self.verify = verify
+    self.tm = None  # Skip token manager for localhost
+    # Credentials never change after init, so build the headers once
+    self._local_headers = {
+        "Service-CRN": crn,
+        "Authorization": f"Bearer {api_key}",
+    }
+
+
+def _patched_get_headers(self) -> dict[str, str]:
+    """Return simple headers without IAM token."""
+    return self._local_headers
+
+
+def _auth_patches(instance: str) -> list[tuple[Any, str, Any]]:
+    """Build the (target, attribute, value) patches shared by both entry points.
+
+    Args:
+        instance: Mock CRN instance identifier returned by list_instances
+
+    Returns:
+        Patches to apply with setattr
+    """
+    original_list_instances = CloudAccount.list_instances
+
+    # Built once; qiskit-ibm-runtime only reads the instance list
+    mock_instances = [{"crn": instance, "plan": "lite", "name": "test-instance"}]
+
+    def patched_list_instances(self) -> list[dict[str, Any]]:
+        """Return mock instance data for local/custom server testing."""
+        # Check if URL is local/custom server (not IBM Cloud)
+        if _is_local_or_custom_server(self.url):
+            return mock_instances
+        # Otherwise use original implementation for IBM Cloud
+        return original_list_instances(self)
+
+    # Note: We need to patch both qpy.QPY_VERSION and the imported QISKIT_QPY_VERSION
+    # in qiskit_ibm_runtime.utils.json, since it imports the value at module load time
+    return [
+        (CloudAccount, "list_instances", patched_list_instances),
+        (CloudAuth, "__init__", _patched_cloudauth_init),
+        (CloudAuth, "get_headers", _patched_get_headers),
+        (qpy, "QPY_VERSION", COMPATIBLE_QPY_VERSION),
+        (runtime_json, "QISKIT_QPY_VERSION", COMPATIBLE_QPY_VERSION),
+    ]
 
 
 @contextmanager
@@ -80,6 +141,7 @@ def local_service_connection(
     token: str = "test-token",
     instance: str = "crn:v1:bluemix:public:quantum-computing:us-east:a/test::test",
     verify: bool = False,
+    cache: bool = True,
 ):
     """Create QiskitRuntimeService connected to local server with auth patching.
 
@@ -96,6 +158,8 @@ def local_service_connection(
         token: Mock token (not validated by local server)
         instance: Mock CRN instance identifier
         verify: SSL verification (typically False for local servers)
+        cache: Cache backend list and configuration responses for the duration
+            of the connection (cleared on exit)
 
     Yields:
         QiskitRuntimeService: Configured service instance
@@ -117,64 +181,50 @@ def local_service_connection(
         >>> with local_service_connection("http://quantum.local:8000") as service:
         ...     backends = service.backends()
     """
-    from qiskit_ibm_runtime.accounts.account import CloudAccount
-    from qiskit_ibm_runtime.api.auth import CloudAuth
-
-    # Patch CloudAccount.list_instances to return mock data
-    original_list_instances = CloudAccount.list_instances
-
-    def patched_list_instances(self) -> list[dict[str, Any]]:
-        """Return mock instance data for local/custom server testing."""
-        # Check if URL is local/custom server (not IBM Cloud)
-        if _is_local_or_custom_server(self.url):
-            return [
-                {
-                    "crn": instance,
-                    "plan": "lite",
-                    "name": "test-instance",
-                }
-            ]
-        # Otherwise use original implementation for IBM Cloud
-        return original_list_instances(self)
-
-    # Patch CloudAuth to bypass IAM authentication
-    _original_cloudauth_init = CloudAuth.__init__
-
-    def patched_cloudauth_init(
-        self, api_key, crn, private=False, proxies=None, verify=True
-    ) -> None:
-        """Skip IAM setup for localhost testing."""
-        self.crn = crn
-        self.api_key = api_key
-        self.private = private
-        self.proxies = proxies
-        self.verify = verify
-        self.tm = None  # Skip token manager for localhost
-
-    def patched_get_headers(self) -> dict[str, str]:
-        """Return simple headers without IAM token."""
-        return {
-            "Service-CRN": self.crn,
-            "Authorization": f"Bearer {self.api_key}",
-        }
-
     # Custom URL resolver that returns local server URL with /v1 prefix
+    resolved_url = f"{url}/v1"
+
     def mock_url_resolver(_base_url, _instance, _private_endpoint=False, _region=None) -> str:
         """Always return the local server URL with /v1 prefix."""
-        return f"{url}/v1"
+        return resolved_url
+
+    original_list_backends = RuntimeClient.list_backends
+    original_backend_configuration = RuntimeClient.backend_configuration
+
+    def cached_list_backends(self) -> list[dict[str, Any]]:
+        """Return the backend list, fetching it from the server only once."""
+        key = (self._session.base_url, None)
+        if key not in _backend_cache:
+            _backend_cache[key] = original_list_backends(self)
+        return list(_backend_cache[key])
+
+    def cached_backend_configuration(
+        self, backend_name, refresh=False, calibration_id=None
+    ) -> dict[str, Any]:
+        """Return backend configuration, fetching it from the server only once."""
+        # Calibration-specific configurations are never cached (same as RuntimeClient)
+        if calibration_id is not None:
+            return original_backend_configuration(self, backend_name, refresh, calibration_id)
+        key = (self._session.base_url, backend_name)
+        if key not in _backend_cache or refresh:
+            _backend_cache[key] = original_backend_configuration(self, backend_name, refresh)
+        return _backend_cache[key].copy()
 
     # Apply patches
-    # Note: We need to patch both qpy.QPY_VERSION and the imported QISKIT_QPY_VERSION
-    # in qiskit_ibm_runtime.utils.json, since it imports the value at module load time
-    from qiskit_ibm_runtime.utils import json as runtime_json
-
-    with (
-        patch.object(CloudAccount, "list_instances", patched_list_instances),
-        patch.object(CloudAuth, "__init__", patched_cloudauth_init),
-        patch.object(CloudAuth, "get_headers", patched_get_headers),
-        patch.object(qpy, "QPY_VERSION", COMPATIBLE_QPY_VERSION),
-        patch.object(runtime_json, "QISKIT_QPY_VERSION", COMPATIBLE_QPY_VERSION),
-    ):
+    patches = _auth_patches(instance)
+    if cache:
+        patches += [
+            (RuntimeClient, "list_backends", cached_list_backends),
+            (RuntimeClient, "backend_configuration", cached_backend_configuration),
+        ]
+
+    # Rebind attributes directly and restore them on exit; unittest.mock.patch
+    # does the same with considerably more setup/teardown per entry
+    originals = [(target, name, getattr(target, name)) for target, name, _ in patches]
+    for target, name, value in patches:
+        setattr(target, name, value)
+
+    try:
         # Create service with custom URL resolver
         service = QiskitRuntimeService(
             channel="ibm_cloud",
@@ -186,6 +236,11 @@ def local_service_connection(
         )
 
         yield service
+    finally:
+        for target, name, value in reversed(originals):
+            setattr(target, name, value)
+        for key in [key for key in _backend_cache if key[0] == resolved_url]:
+            del _backend_cache[key]
 
 
 def create_local_service(
@@ -222,64 +277,16 @@ def create_local_service(
         >>> service = create_local_service("http://192.168.1.100:8000")
         >>> backends = service.backends()
     """
-    from qiskit_ibm_runtime.accounts.account import CloudAccount
-    from qiskit_ibm_runtime.api.auth import CloudAuth
-
-    # Store original methods
-    original_list_instances = CloudAccount.list_instances
-    _original_cloudauth_init = CloudAuth.__init__
-
-    # Monkey-patch CloudAccount.list_instances
-    def patched_list_instances(self) -> list[dict[str, Any]]:
-        """Return mock instance data for local/custom server testing."""
-        # Check if URL is local/custom server (not IBM Cloud)
-        if _is_local_or_custom_server(self.url):
-            return [
-                {
-                    "crn": instance,
-                    "plan": "lite",
-                    "name": "test-instance",
-                }
-            ]
-        # Otherwise use original implementation for IBM Cloud
-        return original_list_instances(self)
-
-    CloudAccount.list_instances = patched_list_instances
-
-    # Monkey-patch CloudAuth
-    def patched_cloudauth_init(
-        self, api_key, crn, private=False, proxies=None, verify=True
-    ) -> None:
-        """Skip IAM setup for localhost testing."""
-        self.crn = crn
-        self.api_key = api_key
-        self.private = private
-        self.proxies = proxies
-        self.verify = verify
-        self.tm = None
-
-    def patched_get_headers(self) -> dict[str, str]:
-        """Return simple headers without IAM token."""
-        return {
-            "Service-CRN": self.crn,
-            "Authorization": f"Bearer {self.api_key}",
-        }
-
-    CloudAuth.__init__ = patched_cloudauth_init
-    CloudAuth.get_headers = patched_get_headers
-
-    # Monkey-patch QPY_VERSION to compatible version
-    # Note: We need to patch both qpy.QPY_VERSION and the imported QISKIT_QPY_VERSION
-    # in qiskit_ibm_runtime.utils.json, since it imports the value at module load time
-    from qiskit_ibm_runtime.utils import json as runtime_json
-
-    qpy.QPY_VERSION = COMPATIBLE_QPY_VERSION
-    runtime_json.QISKIT_QPY_VERSION = COMPATIBLE_QPY_VERSION
+    # Monkey-patch authentication and QPY version
+    for target, name, value in _auth_patches(instance):
+        setattr(target, name, value)
 
     # Custom URL resolver
+    resolved_url = f"{url}/v1"
+
     def mock_url_resolver(_base_url, _instance, _private_endpoint=False, _region=None) -> str:
         """Always return the local server URL with /v1 prefix."""
-        return f"{url}/v1"
+        return resolved_url
 
     # Create service
     service = QiskitRuntimeService(
@@ -307,12 +314,13 @@ if __name__ == "__main__":
 
     with local_service_connection(server_url) as service:
         # List backends
-        backends = service.backends()
-        print(f"\nAvailable backends ({len(backends)}):")
-        for backend in backends[:5]:  # Show first 5
-            print(f"  - {backend.name}")
-        if len(backends) > 5:
-            print(f"  ... and {len(backends) - 5} more")
+        backends = list(service.backends())
+        num_backends = len(backends)
+        print(f"\nAvailable backends ({num_backends}):")
+        # Show first 5 with a single write
+        sys.stdout.write("".join(f"  - {backend.name}\n" for backend in backends[:5]))
+        if num_backends > 5:
+            print(f"  ... and {num_backends - 5} more")
 
         # Run simple circuit
         print("\nRunning Bell state circuit on fake_manila@aer...")
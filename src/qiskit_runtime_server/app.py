@@ -1,13 +1,18 @@
 """FastAPI application factory."""
 
-import json
+import asyncio
+import hashlib
 import logging
+import math
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from datetime import datetime
+from contextlib import asynccontextmanager, suppress
+from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, Header, HTTPException, Query, Response
+from pydantic import BaseModel
 from qiskit_ibm_runtime.utils import RuntimeEncoder
 
 from .executors.base import BaseExecutor
@@ -16,8 +21,11 @@ from .managers.session_manager import SessionManager
 from .models import (
     JobCreateRequest,
     JobCreateResponse,
+    JobInfo,
     JobState,
     JobStatus,
+    JobStatusBatchRequest,
+    JobStatusBatchResponse,
     JobStatusResponse,
     SessionCreateRequest,
     SessionResponse,
@@ -27,26 +35,153 @@ from .providers.backend_metadata import BackendMetadataProvider
 
 logger = logging.getLogger(__name__)
 
+# Separator line around the startup log block
+_BANNER = "=" * 60
 
-class BackendEncoder(json.JSONEncoder):
-    """Custom JSON encoder for backend configuration.
+
+# orjson options for backend metadata: stringify non-str keys like the stdlib
+# encoder, and accept numpy values that custom backends may carry
+_BACKEND_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _backend_default(obj: Any) -> Any:
+    """orjson ``default`` hook for backend metadata.
 
     Converts Python objects to IBM Quantum API compatible JSON format:
     - complex numbers → [real, imag] arrays
-    - datetime objects → ISO 8601 strings
+    - datetime objects → ISO 8601 strings (handled natively by orjson)
+    """
+    if isinstance(obj, complex):
+        return [obj.real, obj.imag]
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# RuntimeEncoder is stateless, so one instance is shared by all result requests
+_RUNTIME_ENCODER = RuntimeEncoder()
+
+# Backend metadata is static for the lifetime of the server
+_BACKEND_CACHE_HEADERS = {"Cache-Control": "public, max-age=300"}
+
+
+# Upper bound for long-polling job status (?wait=seconds)
+_MAX_STATUS_WAIT = 60.0
+
+# Bounds for the poll interval suggested to clients of unfinished jobs
+_MIN_POLL_INTERVAL_MS = 200
+_MAX_POLL_INTERVAL_MS = 5000
+
+# Backend status is constant apart from the queue length, which is spliced in
+_STATUS_PREFIX = b'{"state":true,"status":"active","message":"","length_queue":'
+_STATUS_SUFFIX = b',"backend_version":"1.0.0"}'
+
+
+def _dump_backend_json(content: Any) -> bytes:
+    """Serialize backend metadata to JSON bytes with orjson."""
+    return orjson.dumps(content, default=_backend_default, option=_BACKEND_JSON_OPTIONS)
+
+
+def _encode_results(result_data: Any) -> str:
+    """Encode job results with RuntimeEncoder (the format RuntimeDecoder expects)."""
+    body: str = _RUNTIME_ENCODER.encode(result_data)
+    return body
+
+
+def _suggested_poll_interval_ms(job_info: JobInfo) -> int:
+    """
+    Suggest how long a client should wait before polling a job again.
+
+    Runtimes are not known in advance, so the time the job has spent in its
+    current state stands in for the time still to go: short jobs are polled
+    quickly, long ones progressively less often.
+
+    Args:
+        job_info: Job to poll
+
+    Returns:
+        Interval in milliseconds, or 0 if the job has finished
+    """
+    if job_info.status not in (JobStatus.QUEUED, JobStatus.RUNNING):
+        return 0
+
+    since = job_info.started_at or job_info.created_at
+    elapsed_ms = (datetime.now(UTC) - since).total_seconds() * 1000
+    return int(min(_MAX_POLL_INTERVAL_MS, max(_MIN_POLL_INTERVAL_MS, elapsed_ms / 20)))
+
+
+def _job_status_headers(job_info: JobInfo, poll_interval_ms: int) -> dict[str, str]:
+    """Headers for a job status response: ETag, plus Retry-After while unfinished."""
+    headers = {"ETag": _job_etag(job_info)}
+    if poll_interval_ms > 0:
+        headers["Retry-After"] = str(math.ceil(poll_interval_ms / 1000))
+    return headers
+
+
+def _job_status_response(job_info: JobInfo) -> JobStatusResponse:
+    """Build the status response for a job."""
+    # JobInfo is already validated, so build the response without re-validating
+    return JobStatusResponse.model_construct(
+        id=job_info.job_id,
+        state=JobState.model_construct(
+            status=job_info.status,
+            reason=job_info.error_message,
+        ),
+        created_at=job_info.created_at,
+        started_at=job_info.started_at,
+        completed_at=job_info.completed_at,
+        suggested_poll_interval_ms=_suggested_poll_interval_ms(job_info),
+    )
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
     """
+    Check an If-None-Match header against an ETag (weak comparison, RFC 9110).
+
+    Args:
+        if_none_match: Header value: "*" or a comma-separated list of ETags,
+                       each optionally marked weak with "W/"
+        etag: Current (strong) ETag of the resource
+
+    Returns:
+        True if the client's copy is current and 304 Not Modified applies
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
 
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, complex):
-            return [obj.real, obj.imag]
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+
+def _job_etag(job_info: JobInfo) -> str:
+    """ETag for a job's status; it only changes when the job changes state."""
+    state = f"{job_info.status}|{job_info.started_at}|{job_info.completed_at}"
+    return f'"{hashlib.blake2b(state.encode(), digest_size=8).hexdigest()}"'
+
+
+def _json_response(body: bytes | str, headers: dict[str, str] | None = None) -> Response:
+    """Wrap already-serialized JSON in a response."""
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _model_response(
+    model: BaseModel, status_code: int = 200, headers: dict[str, str] | None = None
+) -> Response:
+    """Serialize a response model with pydantic-core, bypassing jsonable_encoder."""
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
 
 
 def create_app(
     executors: dict[str, BaseExecutor] | None = None,
     statevector_num_qubits: int = 127,
+    max_finished_jobs: int = 10_000,
+    finished_job_ttl: float = 3600.0,
+    circuit_cache_size: int = 128,
 ) -> FastAPI:
     """
     Create FastAPI application with executor injection.
@@ -56,9 +191,19 @@ def create_app(
                   Defaults to {"aer": AerExecutor()}
         statevector_num_qubits: Number of qubits for statevector simulator.
                                Defaults to 127 (matches largest FakeProvider backend).
+        max_finished_jobs: Maximum number of finished jobs (and results) kept;
+                          the oldest are evicted first. Defaults to 10,000.
+        finished_job_ttl: Seconds a finished job (and its results) is kept before
+                         eviction. Defaults to 3600 (1 hour).
+        circuit_cache_size: Number of decoded circuits kept for resubmitted jobs.
+                           Defaults to 128.
 
     Returns:
         FastAPI application instance
+
+    Note:
+        The app does not choose an event loop itself; uvicorn's default
+        (``--loop auto --http auto``) uses uvloop and httptools when installed.
     """
     # Default to AerExecutor if not provided
     if executors is None:
@@ -71,24 +216,45 @@ def create_app(
 
     # Create managers
     session_manager = SessionManager()
-    job_manager = JobManager(executors=executors, session_manager=session_manager)
+    job_manager = JobManager(
+        executors=executors,
+        session_manager=session_manager,
+        max_finished_jobs=max_finished_jobs,
+        finished_job_ttl=finished_job_ttl,
+        circuit_cache_size=circuit_cache_size,
+    )
     metadata_provider = BackendMetadataProvider(available_executors, statevector_num_qubits)
 
+    # Unknown names are rejected with a set lookup before touching the provider
+    valid_backends = metadata_provider.all_backend_names()
+
     # Lifespan context manager for startup/shutdown
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         """Handle startup and shutdown events."""
         # Startup
-        logger.info("=" * 60)
+        logger.info(_BANNER)
         logger.info("Qiskit Runtime Server starting...")
-        logger.info("Available executors: %s", ", ".join(executors.keys()))
-        logger.info("=" * 60)
+        logger.info("Available executors: %s", ", ".join(available_executors))
+        logger.info(_BANNER)
+
+        # Pay simulator start-up costs now rather than on the first job
+        for executor_name, executor in executors.items():
+            try:
+                executor.warmup()
+            except Exception as e:
+                logger.warning("Warmup failed for executor %s: %s", executor_name, e)
 
         yield
 
         # Shutdown
         logger.info("Shutting down...")
         job_manager.shutdown()
+        resolve_backend.cache_clear()
+        list_backends_bytes.cache_clear()
+        list_backends_etag.cache_clear()
+        backend_configuration_bytes.cache_clear()
+        backend_properties_bytes.cache_clear()
         logger.info("Shutdown complete")
 
     # Create FastAPI app
@@ -103,51 +269,34 @@ def create_app(
     app.state.session_manager = session_manager
     app.state.metadata_provider = metadata_provider
 
-    # ===== ENDPOINTS =====
+    # ===== CACHED BACKEND METADATA =====
+    # Backend metadata never changes while the app is running, so name lookups
+    # and serialized JSON are built once per backend. Lookups that raise
+    # HTTPException (404) are not cached.
 
-    @app.get("/")
-    async def root() -> dict[str, Any]:
-        """Root endpoint."""
-        return {
-            "message": "Qiskit Runtime Backend API",
-            "version": "2025-05-01",
-            "executors": list(executors.keys()),
-        }
-
-    @app.get("/v1/backends")
-    async def list_backends(fields: str | None = None) -> dict[str, Any]:
+    @lru_cache(maxsize=1024)
+    def resolve_backend(backend_name: str) -> tuple[str, Any]:
         """
-        List all virtual backends (metadata × executor combinations).
+        Resolve a virtual backend name to its executor name and backend object.
 
         Args:
-            fields: Optional field filter (not yet implemented)
+            backend_name: Backend name in 'metadata@executor' format
 
         Returns:
-            List of backends with metadata
-        """
-        response = metadata_provider.list_backends(fields)
-
-        # Serialize with BackendEncoder to handle datetime and complex numbers
-        json_str = json.dumps(response.model_dump(), cls=BackendEncoder)
-        return json.loads(json_str)  # type: ignore[no-any-return]
+            Tuple of (executor_name, backend)
 
-    @app.get("/v1/backends/{backend_name}/configuration")
-    async def get_backend_configuration(backend_name: str) -> dict[str, Any]:
+        Raises:
+            HTTPException: If the backend does not exist
         """
-        Get configuration for a specific backend.
-
-        Args:
-            backend_name: Backend name in 'metadata@executor' format
+        if backend_name not in valid_backends:
+            raise HTTPException(status_code=404, detail=f"Backend {backend_name} not found")
 
-        Returns:
-            Backend configuration dict
-        """
         # Parse backend name
         parsed = metadata_provider.parse_backend_name(backend_name)
         if not parsed:
             raise HTTPException(status_code=404, detail=f"Backend {backend_name} not found")
 
-        metadata_name, _executor_name = parsed
+        metadata_name, executor_name = parsed
 
         # Get backend (FakeProvider or statevector)
         try:
@@ -155,38 +304,41 @@ def create_app(
         except Exception as e:
             raise HTTPException(status_code=404, detail=f"Backend {backend_name} not found") from e
 
-        # Return configuration dict (same format as list_backends but for single backend)
-        backend_dict = metadata_provider._backend_to_dict(backend)
-        backend_dict["name"] = backend_name
-        backend_dict["backend_name"] = backend_name
+        return executor_name, backend
 
-        # Serialize with BackendEncoder to handle datetime and complex numbers
-        json_str = json.dumps(backend_dict, cls=BackendEncoder)
-        return json.loads(json_str)  # type: ignore[no-any-return]
+    # ``fields`` filtering is not implemented, so one payload serves every request
+    @lru_cache(maxsize=1)
+    def list_backends_bytes() -> bytes:
+        """Serialized virtual backend list."""
+        response = metadata_provider.list_backends()
 
-    @app.get("/v1/backends/{backend_name}/properties")
-    async def get_backend_properties(backend_name: str) -> dict[str, Any]:
-        """
-        Get properties (calibration data) for a specific backend.
+        # Serialize with orjson to handle datetime and complex numbers. The device
+        # dicts are encoded directly; model_dump() would only deep-copy them first.
+        return _dump_backend_json({"devices": response.devices})
 
-        Args:
-            backend_name: Backend name in 'metadata@executor' format
+    @lru_cache(maxsize=1)
+    def list_backends_etag() -> str:
+        """ETag for the serialized virtual backend list."""
+        digest = hashlib.blake2b(list_backends_bytes(), digest_size=16).hexdigest()
+        return f'"{digest}"'
 
-        Returns:
-            Backend properties dict with calibration data
-        """
-        # Parse backend name
-        parsed = metadata_provider.parse_backend_name(backend_name)
-        if not parsed:
-            raise HTTPException(status_code=404, detail=f"Backend {backend_name} not found")
+    @lru_cache(maxsize=256)
+    def backend_configuration_bytes(backend_name: str) -> bytes:
+        """Serialized configuration for a virtual backend."""
+        _executor_name, backend = resolve_backend(backend_name)
+
+        # Return configuration dict (same format as list_backends but for single backend)
+        backend_dict = metadata_provider._backend_to_dict(backend)
+        backend_dict["name"] = backend_name
+        backend_dict["backend_name"] = backend_name
 
-        metadata_name, _executor_name = parsed
+        # Serialize with orjson to handle datetime and complex numbers
+        return _dump_backend_json(backend_dict)
 
-        # Get backend (FakeProvider or statevector)
-        try:
-            backend = metadata_provider.get_backend(metadata_name)
-        except Exception as e:
-            raise HTTPException(status_code=404, detail=f"Backend {backend_name} not found") from e
+    @lru_cache(maxsize=256)
+    def backend_properties_bytes(backend_name: str) -> bytes:
+        """Serialized properties (calibration data) for a virtual backend."""
+        _executor_name, backend = resolve_backend(backend_name)
 
         # Get properties from backend
         if hasattr(backend, "properties") and callable(backend.properties):
@@ -198,17 +350,107 @@ def create_app(
                 # Override backend_name to use virtual backend name
                 props_dict["backend_name"] = backend_name
 
-                # Serialize with BackendEncoder to handle datetime objects
-                json_str = json.dumps(props_dict, cls=BackendEncoder)
-                return json.loads(json_str)  # type: ignore[no-any-return]
+                # Serialize with orjson to handle datetime objects
+                return _dump_backend_json(props_dict)
 
         # Properties not available - return 404
         raise HTTPException(
             status_code=404, detail=f"Properties not available for backend {backend_name}"
         )
 
+    async def wait_for_status_change(job_id: str, status: JobStatus, timeout: float) -> None:
+        """
+        Wait until a job leaves the given status or the timeout elapses.
+
+        Args:
+            job_id: Job ID
+            status: Status the caller last saw
+            timeout: Maximum time to wait in seconds
+        """
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+
+        def notify() -> None:
+            loop.call_soon_threadsafe(changed.set)
+
+        job_manager.add_status_listener(job_id, notify)
+        try:
+            # The job may have moved on before the listener was registered
+            job_info = job_manager.get_job(job_id)
+            if job_info is not None and job_info.status == status:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(changed.wait(), timeout)
+        finally:
+            job_manager.remove_status_listener(job_id, notify)
+
+    # ===== ENDPOINTS =====
+
+    # Root payload only depends on the executor set, which is fixed per app
+    root_bytes = orjson.dumps(
+        {
+            "message": "Qiskit Runtime Backend API",
+            "version": "2025-05-01",
+            "executors": available_executors,
+        }
+    )
+
+    @app.get("/")
+    async def root() -> Response:
+        """Root endpoint."""
+        return _json_response(root_bytes)
+
+    @app.get("/v1/backends")
+    async def list_backends(
+        fields: str | None = None,
+        if_none_match: str | None = Header(default=None),
+    ) -> Response:
+        """
+        List all virtual backends (metadata × executor combinations).
+
+        The list is fixed for the lifetime of the server, so responses carry an
+        ETag and a matching If-None-Match returns 304 Not Modified.
+
+        Args:
+            fields: Optional field filter (not yet implemented; ignored)
+            if_none_match: ETag from a previous response (If-None-Match header)
+
+        Returns:
+            List of backends with metadata
+        """
+        headers = {**_BACKEND_CACHE_HEADERS, "ETag": list_backends_etag()}
+        if _etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        return _json_response(list_backends_bytes(), headers)
+
+    @app.get("/v1/backends/{backend_name}/configuration")
+    async def get_backend_configuration(backend_name: str) -> Response:
+        """
+        Get configuration for a specific backend.
+
+        Args:
+            backend_name: Backend name in 'metadata@executor' format
+
+        Returns:
+            Backend configuration dict
+        """
+        return _json_response(backend_configuration_bytes(backend_name), _BACKEND_CACHE_HEADERS)
+
+    @app.get("/v1/backends/{backend_name}/properties")
+    async def get_backend_properties(backend_name: str) -> Response:
+        """
+        Get properties (calibration data) for a specific backend.
+
+        Args:
+            backend_name: Backend name in 'metadata@executor' format
+
+        Returns:
+            Backend properties dict with calibration data
+        """
+        return _json_response(backend_properties_bytes(backend_name), _BACKEND_CACHE_HEADERS)
+
     @app.get("/v1/backends/{backend_name}/status")
-    async def get_backend_status(backend_name: str) -> dict[str, Any]:
+    async def get_backend_status(backend_name: str) -> Response:
         """
         Get backend operational status.
 
@@ -221,32 +463,16 @@ def create_app(
             Backend status information
         """
         # Parse and validate backend name
-        parsed = metadata_provider.parse_backend_name(backend_name)
-        if not parsed:
-            raise HTTPException(status_code=404, detail=f"Backend {backend_name} not found")
-
-        metadata_name, executor_name = parsed
-
-        # Verify backend metadata exists
-        try:
-            metadata_provider.get_backend(metadata_name)
-        except Exception as e:
-            raise HTTPException(status_code=404, detail=f"Backend {backend_name} not found") from e
+        executor_name, _backend = resolve_backend(backend_name)
 
         # Get queue length for this executor
         queue_length = job_manager.get_queue_length(executor_name)
 
         # Return active status for all local backends
-        return {
-            "state": True,
-            "status": "active",
-            "message": "",
-            "length_queue": queue_length,
-            "backend_version": "1.0.0",
-        }
+        return _json_response(_STATUS_PREFIX + str(queue_length).encode() + _STATUS_SUFFIX)
 
-    @app.post("/v1/jobs", status_code=202)
-    async def create_job(request: JobCreateRequest) -> JobCreateResponse:
+    @app.post("/v1/jobs", status_code=202, response_model=JobCreateResponse)
+    async def create_job(request: JobCreateRequest) -> Response:
         """
         Create a new job (async).
 
@@ -270,17 +496,32 @@ def create_app(
                 options=request.options or {},
                 session_id=request.session_id,
             )
-            return JobCreateResponse(id=job_id, backend=request.backend)
+            return _model_response(
+                JobCreateResponse.model_construct(id=job_id, backend=request.backend),
+                status_code=202,
+            )
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e)) from e
 
-    @app.get("/v1/jobs/{job_id}")
-    async def get_job_status(job_id: str) -> JobStatusResponse:
+    @app.get("/v1/jobs/{job_id}", response_model=JobStatusResponse)
+    async def get_job_status(
+        job_id: str,
+        wait: float = Query(default=0.0, ge=0.0, le=_MAX_STATUS_WAIT),
+        if_none_match: str | None = Header(default=None),
+    ) -> Response:
         """
         Get job status.
 
+        Responses carry an ETag; polling with If-None-Match returns
+        304 Not Modified until the job changes state. With ``wait``, a queued
+        or running job is held until its status changes (long-polling).
+        Unfinished jobs also get a suggested poll interval, in the body and as
+        a Retry-After header.
+
         Args:
             job_id: Job ID
+            wait: Seconds to wait for a status change before responding
+            if_none_match: ETag from a previous response (If-None-Match header)
 
         Returns:
             Job status information
@@ -292,19 +533,39 @@ def create_app(
         if job_info is None:
             raise HTTPException(status_code=404, detail="Job not found")
 
-        return JobStatusResponse(
-            id=job_info.job_id,
-            state=JobState(
-                status=job_info.status,
-                reason=job_info.error_message,
-            ),
-            created_at=job_info.created_at,
-            started_at=job_info.started_at,
-            completed_at=job_info.completed_at,
+        if wait > 0 and job_info.status in (JobStatus.QUEUED, JobStatus.RUNNING):
+            await wait_for_status_change(job_id, job_info.status, wait)
+            job_info = job_manager.get_job(job_id)
+            if job_info is None:
+                raise HTTPException(status_code=404, detail="Job not found")
+
+        response = _job_status_response(job_info)
+        headers = _job_status_headers(job_info, response.suggested_poll_interval_ms or 0)
+        if _etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        return _model_response(response, headers=headers)
+
+    @app.post("/v1/jobs:batchStatus", response_model=JobStatusBatchResponse)
+    async def get_job_statuses(request: JobStatusBatchRequest) -> Response:
+        """
+        Get the status of several jobs in one request.
+
+        Args:
+            request: Job IDs to look up
+
+        Returns:
+            Status information for each known job (unknown IDs are omitted)
+        """
+        jobs = job_manager.get_jobs(request.ids)
+        return _model_response(
+            JobStatusBatchResponse.model_construct(
+                jobs=[_job_status_response(job_info) for job_info in jobs.values()]
+            )
         )
 
     @app.get("/v1/jobs/{job_id}/results")
-    async def get_job_results(job_id: str) -> dict[str, Any]:
+    async def get_job_results(job_id: str) -> Response:
         """
         Get job results.
 
@@ -328,9 +589,15 @@ def create_app(
 
         if job_info.result_data is not None:
             try:
-                json_str = json.dumps(job_info.result_data, cls=RuntimeEncoder)
-                result: dict[str, Any] = json.loads(json_str)
-                return result
+                # Encoding large results can take a while; keep it off the event loop.
+                # RuntimeEncoder output is already valid JSON for the client's
+                # RuntimeDecoder, so it is sent as-is without re-parsing. Results
+                # never change once completed, so later fetches reuse the encoding.
+                body = job_info.result_json
+                if body is None:
+                    body = await asyncio.to_thread(_encode_results, job_info.result_data)
+                    job_info.result_json = body
+                return _json_response(body)
             except Exception as e:
                 logger.error("Failed to serialize results for job %s: %s", job_id, e, exc_info=True)
                 raise HTTPException(
@@ -370,8 +637,8 @@ def create_app(
 
     # ===== SESSION ENDPOINTS =====
 
-    @app.post("/v1/sessions", status_code=201)
-    async def create_session(request: SessionCreateRequest) -> SessionResponse:
+    @app.post("/v1/sessions", status_code=201, response_model=SessionResponse)
+    async def create_session(request: SessionCreateRequest) -> Response:
         """
         Create a new session.
 
@@ -404,10 +671,10 @@ def create_app(
         if response is None:
             raise HTTPException(status_code=500, detail="Failed to create session")
 
-        return response
+        return _model_response(response, status_code=201)
 
-    @app.get("/v1/sessions/{session_id}")
-    async def get_session(session_id: str) -> SessionResponse:
+    @app.get("/v1/sessions/{session_id}", response_model=SessionResponse)
+    async def get_session(session_id: str) -> Response:
         """
         Get session details.
 
@@ -424,10 +691,10 @@ def create_app(
         if response is None:
             raise HTTPException(status_code=404, detail="Session not found")
 
-        return response
+        return _model_response(response)
 
-    @app.patch("/v1/sessions/{session_id}")
-    async def update_session(session_id: str, request: SessionUpdateRequest) -> SessionResponse:
+    @app.patch("/v1/sessions/{session_id}", response_model=SessionResponse)
+    async def update_session(session_id: str, request: SessionUpdateRequest) -> Response:
         """
         Update session settings.
 
@@ -449,7 +716,7 @@ def create_app(
         if response is None:
             raise HTTPException(status_code=404, detail="Session not found")
 
-        return response
+        return _model_response(response)
 
     @app.delete("/v1/sessions/{session_id}/close", status_code=204)
     async def close_session(session_id: str) -> None:
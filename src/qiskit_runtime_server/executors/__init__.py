@@ -1,10 +1,11 @@
 """Executor implementations for quantum circuit execution."""
 
-from .aer import AerExecutor
+from .aer import AER_AVAILABLE, AerExecutor
 from .base import BaseExecutor
 from .custatevec import CUSTATEVEC_AVAILABLE, CuStateVecExecutor
 
 __all__ = [
+    "AER_AVAILABLE",
     "CUSTATEVEC_AVAILABLE",
     "AerExecutor",
     "BaseExecutor",
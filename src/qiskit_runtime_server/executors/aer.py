@@ -1,6 +1,8 @@
 """Aer-based CPU executor implementation."""
 
-from typing import TYPE_CHECKING, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -9,6 +11,14 @@ if TYPE_CHECKING:
 
 from .base import BaseExecutor
 
+# Check if Qiskit Aer is available
+try:
+    from qiskit_aer import AerSimulator
+
+    AER_AVAILABLE = True
+except ImportError:
+    AER_AVAILABLE = False
+
 
 class AerExecutor(BaseExecutor):
     """
@@ -28,6 +38,8 @@ class AerExecutor(BaseExecutor):
         shots: int = 1024,
         seed_simulator: int | None = None,
         max_parallel_threads: int = 0,
+        max_experiments: int | None = None,
+        precision: Literal["double", "single"] = "double",
     ):
         """
         Initialize AerExecutor.
@@ -37,25 +49,44 @@ class AerExecutor(BaseExecutor):
                    or options. Individual PUBs can override this.
             seed_simulator: Random seed for reproducible results.
             max_parallel_threads: Maximum number of parallel threads (0 = auto).
+            max_experiments: Maximum number of PUBs submitted to the simulator in
+                   one run. Larger jobs are split and run serially, which bounds
+                   peak memory. None (default) runs all PUBs at once.
+            precision: Statevector precision. "single" (complex64) halves memory
+                   use and traffic, at the cost of accuracy.
+
+        Raises:
+            ImportError: If Qiskit Aer is not installed.
+            ValueError: If max_experiments is less than 1 or precision is not
+                "double" or "single".
         """
+        if not AER_AVAILABLE:
+            raise ImportError("Qiskit Aer is not installed. Install with: pip install qiskit-aer")
+
+        if max_experiments is not None and max_experiments < 1:
+            raise ValueError(f"max_experiments must be None or >= 1, got {max_experiments}")
+        if precision not in ("double", "single"):
+            raise ValueError(f"precision must be 'double' or 'single', got {precision!r}")
+
+        super().__init__()
         self.shots = shots
         self.seed_simulator = seed_simulator
         self.max_parallel_threads = max_parallel_threads
+        self.max_experiments = max_experiments
+        self.precision = precision
 
     @property
     def name(self) -> str:
         """Return executor name."""
         return "aer"
 
-    def _create_simulator(self) -> Any:
+    def _create_simulator(self) -> AerSimulator:
         """
         Create AerSimulator instance.
 
         Returns:
             AerSimulator: Configured simulator instance.
         """
-        from qiskit_aer import AerSimulator
-
         options: dict[str, Any] = {
             "method": "statevector",
         }
@@ -66,12 +97,15 @@ class AerExecutor(BaseExecutor):
         if self.max_parallel_threads > 0:
             options["max_parallel_threads"] = self.max_parallel_threads
 
+        if self.precision != "double":
+            options["precision"] = self.precision
+
         simulator = AerSimulator(**options)
         return simulator
 
     def execute_sampler(
         self,
-        pubs: "Iterable[SamplerPubLike]",
+        pubs: Iterable[SamplerPubLike],
         options: dict[str, Any],
         backend_name: str,
     ) -> Any:
@@ -91,23 +125,17 @@ class AerExecutor(BaseExecutor):
         Returns:
             PrimitiveResult: Sampler execution result.
         """
-        from qiskit.primitives import BackendSamplerV2
-
-        simulator = self._create_simulator()
-        sampler = BackendSamplerV2(backend=simulator)
+        sampler = self._get_sampler()
 
         # Extract shots from options, fallback to instance default
         shots = options.get("default_shots", self.shots)
 
         # Run sampler
-        job = sampler.run(pubs=pubs, shots=shots)
-        result = job.result()
-
-        return result
+        return self._run_primitive(sampler, pubs, self.max_experiments, shots=shots)
 
     def execute_estimator(
         self,
-        pubs: "Iterable[EstimatorPubLike]",
+        pubs: Iterable[EstimatorPubLike],
         options: dict[str, Any],
         backend_name: str,
     ) -> Any:
@@ -125,20 +153,12 @@ class AerExecutor(BaseExecutor):
         Returns:
             PrimitiveResult: Estimator execution result.
         """
-        from qiskit.primitives import BackendEstimatorV2
-
-        simulator = self._create_simulator()
-        estimator = BackendEstimatorV2(backend=simulator)
+        estimator = self._get_estimator()
 
         # Extract precision from options if provided
         precision = options.get("default_precision")
 
         # Run estimator
         if precision is not None:
-            job = estimator.run(pubs=pubs, precision=precision)
-        else:
-            job = estimator.run(pubs=pubs)
-
-        result = job.result()
-
-        return result
+            return self._run_primitive(estimator, pubs, self.max_experiments, precision=precision)
+        return self._run_primitive(estimator, pubs, self.max_experiments)
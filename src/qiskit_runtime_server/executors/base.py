@@ -1,8 +1,13 @@
 """Base executor interface for circuit execution backends."""
 
+import threading
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from qiskit import QuantumCircuit
+from qiskit.primitives import BackendEstimatorV2, BackendSamplerV2, PrimitiveResult
+from qiskit.quantum_info import SparsePauliOp
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
@@ -19,6 +24,14 @@ class BaseExecutor(ABC):
     simulation backends (CPU, GPU, etc.).
     """
 
+    def __init__(self) -> None:
+        """Initialize the shared simulator and primitive slots."""
+        # Simulator and primitives are created on first use and reused across jobs
+        self._lock = threading.RLock()
+        self._simulator: Any = None
+        self._sampler: BackendSamplerV2 | None = None
+        self._estimator: BackendEstimatorV2 | None = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -30,6 +43,41 @@ class BaseExecutor(ABC):
         """
         pass
 
+    def _create_simulator(self) -> Any:
+        """
+        Create the simulator backend used by the shared primitives.
+
+        Executors that run jobs through _get_sampler/_get_estimator override this.
+
+        Returns:
+            Configured simulator instance (BackendV2).
+
+        Raises:
+            NotImplementedError: If the executor does not provide a simulator.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not provide a simulator")
+
+    def _get_simulator(self) -> Any:
+        """Return the shared simulator, creating it on first use."""
+        with self._lock:
+            if self._simulator is None:
+                self._simulator = self._create_simulator()
+            return self._simulator
+
+    def _get_sampler(self) -> BackendSamplerV2:
+        """Return the shared BackendSamplerV2, creating it on first use."""
+        with self._lock:
+            if self._sampler is None:
+                self._sampler = BackendSamplerV2(backend=self._get_simulator())
+            return self._sampler
+
+    def _get_estimator(self) -> BackendEstimatorV2:
+        """Return the shared BackendEstimatorV2, creating it on first use."""
+        with self._lock:
+            if self._estimator is None:
+                self._estimator = BackendEstimatorV2(backend=self._get_simulator())
+            return self._estimator
+
     @abstractmethod
     def execute_sampler(
         self,
@@ -81,6 +129,69 @@ class BaseExecutor(ABC):
         """
         pass
 
+    def _run_primitive(
+        self,
+        primitive: Any,
+        pubs: "Iterable[Any]",
+        max_experiments: int | None,
+        **run_options: Any,
+    ) -> Any:
+        """
+        Run PUBs on a primitive, optionally in chunks of at most max_experiments.
+
+        Chunks are submitted one after another to the same primitive and their
+        PUB results are merged into a single PrimitiveResult, in input order.
+        Per-PUB metadata stays on each PUB result. The top-level metadata is
+        taken from the first chunk: it describes the primitive (e.g.
+        {"version": 2}) rather than the PUBs, so it is the same for every chunk
+        and the merged result matches an unchunked run.
+
+        Args:
+            primitive: Sampler or estimator instance (V2 interface).
+            pubs: Iterable of PUBs to run.
+            max_experiments: Maximum number of PUBs per primitive run.
+                             None runs all PUBs at once.
+            **run_options: Extra keyword arguments for primitive.run().
+
+        Returns:
+            PrimitiveResult: Execution result covering all PUBs.
+        """
+        if max_experiments is None:
+            return primitive.run(pubs=pubs, **run_options).result()
+
+        pubs = list(pubs)
+        if len(pubs) <= max_experiments:
+            return primitive.run(pubs=pubs, **run_options).result()
+
+        chunk_results = [
+            primitive.run(pubs=pubs[start : start + max_experiments], **run_options).result()
+            for start in range(0, len(pubs), max_experiments)
+        ]
+        pub_results = [pub_result for result in chunk_results for pub_result in result]
+        return PrimitiveResult(pub_results, metadata=dict(chunk_results[0].metadata))
+
+    def warmup(self) -> None:
+        """
+        Run minimal sampler and estimator jobs so one-time initialization happens up front.
+
+        Called at server startup. This loads the simulator libraries and creates
+        any cached simulator and primitives (and, for GPU executors, the device
+        context) before the first client job arrives.
+        """
+        circuit = QuantumCircuit(1)
+        self.execute_estimator(
+            pubs=[(circuit, SparsePauliOp("Z"))],
+            options={},
+            backend_name="statevector_simulator",
+        )
+
+        circuit.measure_all()
+        self.execute_sampler(
+            pubs=[(circuit,)],
+            options={"default_shots": 1},
+            backend_name="statevector_simulator",
+        )
+
     def get_backend_metadata_provider(self) -> Any:
         """
         Get the backend metadata provider singleton.
@@ -7,9 +7,7 @@ cuQuantum installation.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-
-from qiskit.primitives import BackendEstimatorV2, BackendSamplerV2
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -49,6 +47,9 @@ class CuStateVecExecutor(BaseExecutor):
         shots: int = 1024,
         seed_simulator: int | None = None,
         max_parallel_threads: int = 0,
+        max_experiments: int | None = None,
+        fusion_max_qubits: int | None = None,
+        precision: Literal["double", "single"] = "double",
     ):
         """
         Initialize CuStateVecExecutor.
@@ -59,19 +60,40 @@ class CuStateVecExecutor(BaseExecutor):
                    or options. Individual PUBs can override this.
             seed_simulator: Random seed for reproducible results.
             max_parallel_threads: Maximum number of parallel threads (0 = auto).
+            max_experiments: Maximum number of PUBs submitted to the simulator in
+                   one run. Larger jobs are split and run serially, which bounds
+                   peak memory. None (default) runs all PUBs at once.
+            fusion_max_qubits: Maximum width of fused gate blocks. Larger blocks
+                   mean fewer kernel launches on deep circuits but bigger matrices.
+                   None (default) keeps the simulator's setting.
+            precision: Statevector precision. "single" (complex64) halves memory
+                   use and traffic, at the cost of accuracy.
 
         Raises:
             ImportError: If cuQuantum is not installed.
+            ValueError: If max_experiments or fusion_max_qubits is less than 1, or
+                precision is not "double" or "single".
         """
         if not CUSTATEVEC_AVAILABLE:
             raise ImportError(
                 "cuQuantum is not installed. Install with: pip install cuquantum-python"
             )
 
+        if max_experiments is not None and max_experiments < 1:
+            raise ValueError(f"max_experiments must be None or >= 1, got {max_experiments}")
+        if precision not in ("double", "single"):
+            raise ValueError(f"precision must be 'double' or 'single', got {precision!r}")
+        if fusion_max_qubits is not None and fusion_max_qubits < 1:
+            raise ValueError(f"fusion_max_qubits must be None or >= 1, got {fusion_max_qubits}")
+
+        super().__init__()
         self.device_id = device_id
         self.shots = shots
         self.seed_simulator = seed_simulator
         self.max_parallel_threads = max_parallel_threads
+        self.max_experiments = max_experiments
+        self.precision = precision
+        self.fusion_max_qubits = fusion_max_qubits
 
     @property
     def name(self) -> str:
@@ -93,6 +115,13 @@ class CuStateVecExecutor(BaseExecutor):
         if self.max_parallel_threads > 0:
             options["max_parallel_threads"] = self.max_parallel_threads
 
+        if self.precision != "double":
+            options["precision"] = self.precision
+
+        # Gate fusion is on by default; only the block width is tunable here
+        if self.fusion_max_qubits is not None:
+            options["fusion_max_qubit"] = self.fusion_max_qubits
+
         # Set CUDA device ID if specified
         if self.device_id > 0:
             options["device_id"] = self.device_id
@@ -122,17 +151,13 @@ class CuStateVecExecutor(BaseExecutor):
         Returns:
             PrimitiveResult: Sampler execution result.
         """
-        simulator = self._create_simulator()
-        sampler = BackendSamplerV2(backend=simulator)
+        sampler = self._get_sampler()
 
         # Extract shots from options, fallback to instance default
         shots = options.get("default_shots", self.shots)
 
         # Run sampler on GPU
-        job = sampler.run(pubs=pubs, shots=shots)
-        result = job.result()
-
-        return result
+        return self._run_primitive(sampler, pubs, self.max_experiments, shots=shots)
 
     def execute_estimator(
         self,
@@ -154,18 +179,12 @@ class CuStateVecExecutor(BaseExecutor):
         Returns:
             PrimitiveResult: Estimator execution result.
         """
-        simulator = self._create_simulator()
-        estimator = BackendEstimatorV2(backend=simulator)
+        estimator = self._get_estimator()
 
         # Extract precision from options if provided
         precision = options.get("default_precision")
 
         # Run estimator on GPU
         if precision is not None:
-            job = estimator.run(pubs=pubs, precision=precision)
-        else:
-            job = estimator.run(pubs=pubs)
-
-        result = job.result()
-
-        return result
+            return self._run_primitive(estimator, pubs, self.max_experiments, precision=precision)
+        return self._run_primitive(estimator, pubs, self.max_experiments)
@@ -1,9 +1,12 @@
-"""Job Manager with async queue and single worker."""
+"""Job Manager with async queues and one worker per executor."""
 
-import json
+import hashlib
 import logging
 import queue
 import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
@@ -15,24 +18,55 @@ from ..models import JobInfo, JobStatus
 from ..providers.backend_metadata import BackendMetadataProvider, get_backend_metadata_provider
 
 if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
     from ..managers import SessionManager
 
 logger = logging.getLogger(__name__)
 
+# RuntimeDecoder keeps no state between objects, so one instance is shared
+_RUNTIME_DECODER = RuntimeDecoder()
+
+
+def _decode_runtime_objects(
+    value: Any, object_hook: Callable[[dict[str, Any]], Any] = _RUNTIME_DECODER.object_hook
+) -> Any:
+    """
+    Apply RuntimeDecoder's object hook to already-parsed JSON data.
+
+    Objects are decoded bottom-up, exactly as json.loads(..., cls=RuntimeDecoder)
+    would, but without re-serializing the data to a JSON string first. New
+    containers are built, so the input is left unchanged.
+    """
+    if isinstance(value, dict):
+        return object_hook(
+            {key: _decode_runtime_objects(item, object_hook) for key, item in value.items()}
+        )
+    if isinstance(value, list | tuple):
+        return [_decode_runtime_objects(item, object_hook) for item in value]
+    return value
+
 
 class JobManager:
     """
     Manage job lifecycle with async queueing.
 
     Features:
-    - Jobs are queued (FIFO)
-    - Single worker thread processes jobs sequentially
+    - Jobs are queued (FIFO) per executor
+    - One worker thread per executor processes its jobs sequentially, so
+      different executors (e.g. CPU and GPU) run jobs in parallel
     - Executor selection based on backend name
     - Thread-safe job state management
+    - Finished jobs are evicted by age (TTL) and count (oldest first)
     """
 
     def __init__(
-        self, executors: dict[str, BaseExecutor], session_manager: "SessionManager | None" = None
+        self,
+        executors: dict[str, BaseExecutor],
+        session_manager: "SessionManager | None" = None,
+        max_finished_jobs: int = 10_000,
+        finished_job_ttl: float = 3600.0,
+        circuit_cache_size: int = 128,
     ):
         """
         Initialize job manager with executors.
@@ -41,6 +75,11 @@ class JobManager:
             executors: Mapping of executor name to executor instance
                       Example: {"aer": AerExecutor(), "custatevec": CuStateVecExecutor()}
             session_manager: Optional SessionManager for session-aware job execution
+            max_finished_jobs: Maximum number of finished (completed, failed or
+                              cancelled) jobs kept; the oldest are evicted first
+            finished_job_ttl: Seconds a finished job (and its results) is kept
+            circuit_cache_size: Number of decoded circuits kept, keyed by their QPY
+                               payload, so resubmitted circuits are not decoded again
         """
         self.executors = executors
         self.jobs: dict[str, JobInfo] = {}
@@ -48,14 +87,36 @@ class JobManager:
         self._metadata_provider: BackendMetadataProvider | None = None
         self._session_manager = session_manager
 
-        # Job queue (FIFO)
-        self._queue: queue.Queue[str] = queue.Queue()
-
-        # Worker thread
-        self._worker_thread: threading.Thread | None = None
+        # Finished job IDs in completion order, with their monotonic finish time.
+        # Queued/running jobs are never evicted.
+        self.max_finished_jobs = max_finished_jobs
+        self.finished_job_ttl = finished_job_ttl
+        self._finished_jobs: OrderedDict[str, float] = OrderedDict()
+
+        # Indexes so queue lengths and session cancellation don't scan all jobs:
+        # queued/running job IDs per executor, and queued job IDs per session
+        self._active_jobs: dict[str, set[str]] = {name: set() for name in executors}
+        self._queued_session_jobs: dict[str, set[str]] = {}
+
+        # Decoded circuits (LRU) keyed by a hash of their QPY payload. Workers for
+        # different executors decode in parallel, so the cache has its own lock.
+        self.circuit_cache_size = circuit_cache_size
+        self._circuit_cache: OrderedDict[bytes, QuantumCircuit] = OrderedDict()
+        self._circuit_cache_lock = threading.Lock()
+
+        # Callbacks run whenever a job changes status (used for long-polling)
+        self._status_listeners: dict[str, list[Callable[[], None]]] = {}
+
+        # Job queues (FIFO), one per executor. None is the shutdown sentinel.
+        self._queues: dict[str, queue.SimpleQueue[str | None]] = {
+            name: queue.SimpleQueue() for name in executors
+        }
+
+        # Worker threads, one per executor
+        self._worker_threads: dict[str, threading.Thread] = {}
         self._shutdown_flag = threading.Event()
 
-        # Start worker
+        # Start workers
         self._start_worker()
 
     @property
@@ -67,46 +128,54 @@ class JobManager:
         return self._metadata_provider
 
     def _start_worker(self) -> None:
-        """Start background worker thread."""
-        if self._worker_thread is not None and self._worker_thread.is_alive():
-            logger.warning("Worker thread already running")
-            return
-
+        """Start a background worker thread for each executor."""
         self._shutdown_flag.clear()
-        self._worker_thread = threading.Thread(
-            target=self._worker_loop, name="JobWorker", daemon=True
-        )
-        self._worker_thread.start()
-        logger.info("Job worker thread started")
+        for executor_name in self._queues:
+            worker_thread = self._worker_threads.get(executor_name)
+            if worker_thread is not None and worker_thread.is_alive():
+                logger.warning("Worker thread already running: %s", executor_name)
+                continue
+
+            worker_thread = threading.Thread(
+                target=self._worker_loop,
+                args=(executor_name,),
+                name=f"JobWorker-{executor_name}",
+                daemon=True,
+            )
+            self._worker_threads[executor_name] = worker_thread
+            worker_thread.start()
+            logger.info("Job worker thread started: %s", executor_name)
 
-    def _worker_loop(self) -> None:
+    def _worker_loop(self, executor_name: str) -> None:
         """
         Worker thread main loop.
 
-        Continuously polls the job queue and executes jobs sequentially.
-        Only one job is executed at a time.
+        Blocks on one executor's job queue and executes its jobs sequentially.
+        Only one job per executor is executed at a time. Idle workers sleep
+        until a job or the shutdown sentinel arrives.
+
+        Args:
+            executor_name: Executor whose queue this worker drains
         """
-        logger.info("Worker loop started")
+        logger.info("Worker loop started: %s", executor_name)
+        job_queue = self._queues[executor_name]
 
-        while not self._shutdown_flag.is_set():
+        while True:
             try:
-                # Wait for next job (timeout to check shutdown flag)
-                try:
-                    job_id = self._queue.get(timeout=1.0)
-                except queue.Empty:
-                    continue
+                # Wait for next job; shutdown() wakes the worker with None.
+                # Jobs still queued at shutdown are left QUEUED.
+                job_id = job_queue.get()
+                if job_id is None or self._shutdown_flag.is_set():
+                    break
 
                 # Execute job
-                logger.info("Worker picked up job: %s", job_id)
+                logger.info("Worker %s picked up job: %s", executor_name, job_id)
                 self._execute_job(job_id)
 
-                # Mark task as done
-                self._queue.task_done()
-
             except Exception as e:
                 logger.error("Worker loop error: %s", e, exc_info=True)
 
-        logger.info("Worker loop stopped")
+        logger.info("Worker loop stopped: %s", executor_name)
 
     def create_job(
         self,
@@ -136,6 +205,9 @@ class JobManager:
         parsed = self.metadata_provider.parse_backend_name(backend_name)
         if parsed is None:
             raise ValueError(f"Invalid backend name: {backend_name}")
+        job_queue = self._queues.get(parsed[1])
+        if job_queue is None:
+            raise ValueError(f"Executor not found: {parsed[1]}")
 
         # Validate session if provided
         if session_id is not None and self._session_manager is not None:
@@ -170,9 +242,14 @@ class JobManager:
             created_at=datetime.now(UTC),
         )
 
-        # Store job
+        # Store and index job together, so queue length and session
+        # cancellation see it as soon as it exists
         with self._lock:
+            self._evict_finished_jobs()
             self.jobs[job_id] = job_info
+            self._active_jobs[parsed[1]].add(job_id)
+            if session_id is not None:
+                self._queued_session_jobs.setdefault(session_id, set()).add(job_id)
 
         # Add job to session if provided
         if (
@@ -183,10 +260,13 @@ class JobManager:
             # Failed to add to session - clean up job
             with self._lock:
                 del self.jobs[job_id]
+                self._active_jobs[parsed[1]].discard(job_id)
+                self._unindex_queued_session_job(job_info)
+                self._finished_jobs.pop(job_id, None)
             raise ValueError(f"Failed to add job to session {session_id}")
 
-        # Add to queue
-        self._queue.put(job_id)
+        # Add to the executor's queue
+        job_queue.put(job_id)
 
         logger.info(
             "Job created and queued: %s (backend: %s, session: %s)",
@@ -219,6 +299,8 @@ class JobManager:
             with self._lock:
                 job_info.status = JobStatus.RUNNING
                 job_info.started_at = datetime.now(UTC)
+                self._unindex_queued_session_job(job_info)
+            self._notify_status_change(job_id)
 
             logger.info(
                 "Executing job %s: %s on %s",
@@ -261,6 +343,8 @@ class JobManager:
                 job_info.status = JobStatus.COMPLETED
                 job_info.completed_at = datetime.now(UTC)
                 job_info.result_data = result
+                self._mark_finished(job_info)
+            self._notify_status_change(job_id)
 
             logger.info("Job completed: %s", job_id)
 
@@ -271,6 +355,43 @@ class JobManager:
                 job_info.status = JobStatus.FAILED
                 job_info.completed_at = datetime.now(UTC)
                 job_info.error_message = str(e)
+                self._mark_finished(job_info)
+            self._notify_status_change(job_id)
+
+    def _mark_finished(self, job_info: JobInfo) -> None:
+        """Record that a job reached a terminal state (caller holds the lock)."""
+        job_id = job_info.job_id
+        parsed = self.metadata_provider.parse_backend_name(job_info.backend_name)
+        if parsed is not None and parsed[1] in self._active_jobs:
+            self._active_jobs[parsed[1]].discard(job_id)
+        self._unindex_queued_session_job(job_info)
+
+        self._finished_jobs[job_id] = time.monotonic()
+        self._evict_finished_jobs()
+
+    def _unindex_queued_session_job(self, job_info: JobInfo) -> None:
+        """Drop a job from its session's queued-job index (caller holds the lock)."""
+        if job_info.session_id is None:
+            return
+        session_jobs = self._queued_session_jobs.get(job_info.session_id)
+        if session_jobs is None:
+            return
+        session_jobs.discard(job_info.job_id)
+        if not session_jobs:
+            del self._queued_session_jobs[job_info.session_id]
+
+    def _evict_finished_jobs(self) -> None:
+        """Drop finished jobs past the TTL or over the size cap (caller holds the lock)."""
+        finished = self._finished_jobs
+        cutoff = time.monotonic() - self.finished_job_ttl
+        while finished:
+            job_id, finished_at = next(iter(finished.items()))
+            if len(finished) <= self.max_finished_jobs and finished_at > cutoff:
+                break
+            del finished[job_id]
+            self.jobs.pop(job_id, None)
+            self._status_listeners.pop(job_id, None)
+            logger.debug("Evicted finished job: %s", job_id)
 
     def _deserialize_params(self, params: dict[str, Any]) -> dict[str, Any]:
         """
@@ -285,17 +406,44 @@ class JobManager:
         Raises:
             Exception: If deserialization fails (propagated to caller)
         """
-        # Use RuntimeDecoder to deserialize circuits and observables
-        # RuntimeDecoder is used as object_hook in json.loads
+        # Use RuntimeDecoder's object hook to deserialize circuits and observables.
+        # params is already parsed JSON, so the hook is applied to it directly
+        # instead of round-tripping through json.dumps/json.loads.
         try:
-            # Serialize to JSON string then deserialize with RuntimeDecoder
-            json_str = json.dumps(params)
-            deserialized: dict[str, Any] = json.loads(json_str, cls=RuntimeDecoder)
+            deserialized: dict[str, Any] = _decode_runtime_objects(
+                params, self._decode_runtime_object
+            )
             return deserialized
         except Exception as e:
-            logger.error("Failed to deserialize params: %s", e, exc_info=True)
+            # The caller logs the failed job with its traceback; don't format it twice
+            logger.error("Failed to deserialize params: %s", e)
             raise
 
+    def _decode_runtime_object(self, obj: dict[str, Any]) -> Any:
+        """
+        RuntimeDecoder object hook that reuses previously decoded circuits.
+
+        Variational workloads resubmit the same circuit with new parameter
+        values, so QPY payloads repeat. A copy of the cached circuit is returned
+        so that jobs never share a mutable circuit.
+        """
+        if obj.get("__type__") != "QuantumCircuit" or self.circuit_cache_size <= 0:
+            return _RUNTIME_DECODER.object_hook(obj)
+
+        key = hashlib.blake2b(obj["__value__"].encode(), digest_size=16).digest()
+        with self._circuit_cache_lock:
+            circuit = self._circuit_cache.get(key)
+            if circuit is not None:
+                self._circuit_cache.move_to_end(key)
+                return circuit.copy()
+
+        circuit = _RUNTIME_DECODER.object_hook(obj)
+        with self._circuit_cache_lock:
+            self._circuit_cache[key] = circuit
+            while len(self._circuit_cache) > self.circuit_cache_size:
+                self._circuit_cache.popitem(last=False)
+        return circuit.copy()
+
     def get_job(self, job_id: str) -> JobInfo | None:
         """
         Get job information.
@@ -309,6 +457,20 @@ class JobManager:
         with self._lock:
             return self.jobs.get(job_id)
 
+    def get_jobs(self, job_ids: list[str]) -> dict[str, JobInfo]:
+        """
+        Get information for several jobs under a single lock acquisition.
+
+        Args:
+            job_ids: Job IDs
+
+        Returns:
+            Mapping of job_id to JobInfo for the IDs that exist
+        """
+        with self._lock:
+            jobs = self.jobs
+            return {job_id: jobs[job_id] for job_id in job_ids if job_id in jobs}
+
     def list_jobs(self) -> dict[str, JobInfo]:
         """
         List all jobs.
@@ -335,16 +497,16 @@ class JobManager:
         """
         with self._lock:
             job_info = self.jobs.get(job_id)
-            if job_info is None:
+            if job_info is None or job_info.status != JobStatus.QUEUED:
                 return False
 
-            if job_info.status == JobStatus.QUEUED:
-                job_info.status = JobStatus.CANCELLED
-                job_info.completed_at = datetime.now(UTC)
-                job_info.error_message = "Cancelled by user"
-                return True
+            job_info.status = JobStatus.CANCELLED
+            job_info.completed_at = datetime.now(UTC)
+            job_info.error_message = "Cancelled by user"
+            self._mark_finished(job_info)
 
-            return False
+        self._notify_status_change(job_id)
+        return True
 
     def cancel_session_jobs(self, session_id: str) -> int:
         """
@@ -356,18 +518,63 @@ class JobManager:
         Returns:
             Number of jobs cancelled
         """
-        cancelled_count = 0
+        cancelled = []
         with self._lock:
-            for job_info in self.jobs.values():
-                if job_info.session_id == session_id and job_info.status == JobStatus.QUEUED:
-                    job_info.status = JobStatus.CANCELLED
-                    job_info.completed_at = datetime.now(UTC)
-                    job_info.error_message = "Cancelled due to session cancellation"
-                    cancelled_count += 1
+            for job_id in list(self._queued_session_jobs.get(session_id, ())):
+                job_info = self.jobs[job_id]
+                job_info.status = JobStatus.CANCELLED
+                job_info.completed_at = datetime.now(UTC)
+                job_info.error_message = "Cancelled due to session cancellation"
+                self._mark_finished(job_info)
+                cancelled.append(job_id)
 
+        for job_id in cancelled:
+            self._notify_status_change(job_id)
+
+        cancelled_count = len(cancelled)
         logger.info("Cancelled %d jobs from session %s", cancelled_count, session_id)
         return cancelled_count
 
+    def add_status_listener(self, job_id: str, callback: Callable[[], None]) -> None:
+        """
+        Register a callback to run whenever a job changes status.
+
+        The callback runs on the thread that changed the status (usually the
+        worker thread), so it must be thread-safe and return quickly.
+
+        Args:
+            job_id: Job ID
+            callback: Function called with no arguments on each status change
+        """
+        with self._lock:
+            self._status_listeners.setdefault(job_id, []).append(callback)
+
+    def remove_status_listener(self, job_id: str, callback: Callable[[], None]) -> None:
+        """
+        Unregister a callback added with add_status_listener().
+
+        Args:
+            job_id: Job ID
+            callback: Previously registered callback
+        """
+        with self._lock:
+            listeners = self._status_listeners.get(job_id)
+            if listeners is None or callback not in listeners:
+                return
+            listeners.remove(callback)
+            if not listeners:
+                del self._status_listeners[job_id]
+
+    def _notify_status_change(self, job_id: str) -> None:
+        """Run status listeners for a job (outside the job lock)."""
+        with self._lock:
+            listeners = list(self._status_listeners.get(job_id, ()))
+        for callback in listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning("Status listener for job %s failed: %s", job_id, e)
+
     def get_queue_length(self, executor_name: str | None = None) -> int:
         """
         Get number of jobs in queue (QUEUED + RUNNING) for a specific executor.
@@ -382,33 +589,21 @@ class JobManager:
         with self._lock:
             if executor_name is None:
                 # Return total count of QUEUED + RUNNING jobs
-                return sum(
-                    1
-                    for job in self.jobs.values()
-                    if job.status in (JobStatus.QUEUED, JobStatus.RUNNING)
-                )
+                return sum(len(job_ids) for job_ids in self._active_jobs.values())
 
-            # Filter by executor name
-            count = 0
-            for job in self.jobs.values():
-                if job.status not in (JobStatus.QUEUED, JobStatus.RUNNING):
-                    continue
-
-                # Parse backend name to get executor
-                parsed = self.metadata_provider.parse_backend_name(job.backend_name)
-                if parsed and parsed[1] == executor_name:
-                    count += 1
-
-            return count
+            return len(self._active_jobs.get(executor_name, ()))
 
     def shutdown(self) -> None:
-        """Shutdown worker thread gracefully."""
+        """Shutdown worker threads gracefully."""
         logger.info("Shutting down job manager...")
         self._shutdown_flag.set()
-
-        if self._worker_thread is not None:
-            self._worker_thread.join(timeout=5.0)
-            if self._worker_thread.is_alive():
-                logger.warning("Worker thread did not stop in time")
+        for executor_name, worker_thread in self._worker_threads.items():
+            if worker_thread.is_alive():
+                self._queues[executor_name].put(None)
+
+        for executor_name, worker_thread in self._worker_threads.items():
+            worker_thread.join(timeout=5.0)
+            if worker_thread.is_alive():
+                logger.warning("Worker thread did not stop in time: %s", executor_name)
             else:
-                logger.info("Worker thread stopped")
+                logger.info("Worker thread stopped: %s", executor_name)
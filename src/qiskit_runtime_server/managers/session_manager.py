@@ -1,8 +1,9 @@
 """Session Manager for managing session lifecycle and job execution modes."""
 
+import heapq
 import logging
 import threading
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 from ..models import SessionInfo, SessionMode, SessionResponse
@@ -20,13 +21,21 @@ class SessionManager:
     - Backend validation for session jobs
     - Session close and cancel operations
     - TTL tracking
+    - Lock-free reads: the sessions dict is copy-on-write
     """
 
     def __init__(self) -> None:
         """Initialize session manager."""
+        # Never mutated in place: writers publish a new dict under the lock, so
+        # readers can use whichever dict self.sessions refers to without locking.
+        # SessionInfo fields are still only changed under the lock.
         self.sessions: dict[str, SessionInfo] = {}
         self._lock = threading.Lock()
 
+        # Min-heap of (expiry time, session_id), so cleanup only looks at
+        # sessions that have actually expired
+        self._expiry_heap: list[tuple[datetime, str]] = []
+
     def create_session(
         self,
         mode: SessionMode,
@@ -60,8 +69,10 @@ class SessionManager:
             job_ids=[],
         )
 
+        expires_at = session_info.created_at + timedelta(seconds=max_ttl)
         with self._lock:
-            self.sessions[session_id] = session_info
+            self.sessions = {**self.sessions, session_id: session_info}
+            heapq.heappush(self._expiry_heap, (expires_at, session_id))
 
         logger.info(
             "Session created: %s (mode: %s, backend: %s)",
@@ -81,8 +92,7 @@ class SessionManager:
         Returns:
             SessionInfo or None if not found
         """
-        with self._lock:
-            return self.sessions.get(session_id)
+        return self.sessions.get(session_id)
 
     def get_session_response(self, session_id: str) -> SessionResponse | None:
         """
@@ -101,7 +111,8 @@ class SessionManager:
         # Calculate elapsed time
         elapsed_time = int((datetime.now(UTC) - session_info.created_at).total_seconds())
 
-        return SessionResponse(
+        # Fields come from an already-validated SessionInfo, so skip re-validation
+        return SessionResponse.model_construct(
             id=session_info.session_id,
             mode=session_info.mode,
             backend=session_info.backend_name,
@@ -218,12 +229,11 @@ class SessionManager:
         Returns:
             True if backend matches, False otherwise
         """
-        with self._lock:
-            session_info = self.sessions.get(session_id)
-            if session_info is None:
-                return False
+        session_info = self.sessions.get(session_id)
+        if session_info is None:
+            return False
 
-            return session_info.backend_name == backend_name
+        return session_info.backend_name == backend_name
 
     def get_session_mode(self, session_id: str) -> SessionMode | None:
         """
@@ -235,11 +245,10 @@ class SessionManager:
         Returns:
             SessionMode or None if session not found
         """
-        with self._lock:
-            session_info = self.sessions.get(session_id)
-            if session_info is None:
-                return None
-            return session_info.mode
+        session_info = self.sessions.get(session_id)
+        if session_info is None:
+            return None
+        return session_info.mode
 
     def list_sessions(self) -> dict[str, SessionInfo]:
         """
@@ -248,8 +257,7 @@ class SessionManager:
         Returns:
             Mapping of session_id to SessionInfo
         """
-        with self._lock:
-            return dict(self.sessions)
+        return dict(self.sessions)
 
     def cleanup_expired_sessions(self) -> int:
         """
@@ -262,13 +270,20 @@ class SessionManager:
         expired_session_ids: list[str] = []
 
         with self._lock:
-            for session_id, session_info in self.sessions.items():
-                elapsed = (now - session_info.created_at).total_seconds()
-                if elapsed > session_info.max_ttl:
+            heap = self._expiry_heap
+            while heap and heap[0][0] < now:
+                _, session_id = heapq.heappop(heap)
+                if session_id in self.sessions:
                     expired_session_ids.append(session_id)
 
-            for session_id in expired_session_ids:
-                del self.sessions[session_id]
-                logger.info("Expired session cleaned up: %s", session_id)
+            if expired_session_ids:
+                expired = set(expired_session_ids)
+                self.sessions = {
+                    session_id: session_info
+                    for session_id, session_info in self.sessions.items()
+                    if session_id not in expired
+                }
+                for session_id in expired_session_ids:
+                    logger.info("Expired session cleaned up: %s", session_id)
 
         return len(expired_session_ids)
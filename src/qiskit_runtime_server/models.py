@@ -41,6 +41,7 @@ class JobInfo(BaseModel):
 
     # Results
     result_data: Any | None = None  # PrimitiveResult
+    result_json: str | None = None  # RuntimeEncoder output, cached on first fetch
     error_message: str | None = None
 
 
@@ -79,6 +80,19 @@ class JobStatusResponse(BaseModel):
     created_at: datetime
     started_at: datetime | None = None
     completed_at: datetime | None = None
+    suggested_poll_interval_ms: int | None = None  # 0 once the job is finished
+
+
+class JobStatusBatchRequest(BaseModel):
+    """Request model for fetching the status of several jobs."""
+
+    ids: list[str]
+
+
+class JobStatusBatchResponse(BaseModel):
+    """Response model for batch job status (unknown job IDs are omitted)."""
+
+    jobs: list[JobStatusResponse]
 
 
 class JobResultResponse(BaseModel):
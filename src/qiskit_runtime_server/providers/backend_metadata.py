@@ -1,5 +1,6 @@
 """Backend metadata provider using FakeProviderForBackendV2."""
 
+from functools import cached_property
 from typing import Any
 
 from qiskit.providers.fake_provider import GenericBackendV2
@@ -38,15 +39,27 @@ class BackendMetadataProvider:
                                    Defaults to 127 (matches largest FakeProvider backend).
         """
         self.available_executors = available_executors
+        self._executor_set = frozenset(available_executors)
         self.provider = FakeProviderForBackendV2()
         self.statevector_num_qubits = statevector_num_qubits
 
-        # Create statevector backend
-        self._statevector_backend = self._create_statevector_backend()
+        # FakeProvider backends by name, in provider order; the set is fixed, so
+        # listing and look-ups never need to go back to the provider
+        self._fake_backends: dict[str, Any] = {
+            backend.name: backend for backend in self.provider.backends()
+        }
+
+        # Valid backend names are a finite set, so successful parses are memoized
+        self._parsed_names: dict[str, tuple[str, str]] = {}
+
+    @cached_property
+    def _statevector_backend(self) -> GenericBackendV2:
+        """Statevector backend metadata, built on first use."""
+        return self._create_statevector_backend()
 
     def _create_statevector_backend(self) -> GenericBackendV2:
         """Create statevector backend metadata."""
-        return GenericBackendV2(
+        backend = GenericBackendV2(
             num_qubits=self.statevector_num_qubits,
             basis_gates=[
                 "cx",
@@ -68,6 +81,10 @@ class BackendMetadataProvider:
             ],
             coupling_map=None,  # Fully connected (no topology constraints)
         )
+        # Only one statevector name exists, so the name is set once here rather
+        # than on each look-up (GenericBackendV2 takes no name argument)
+        backend._name = STATEVECTOR_BACKEND_NAMES[0]
+        return backend
 
     def _is_statevector_backend(self, metadata_name: str) -> bool:
         """Check if backend name is a statevector backend."""
@@ -75,16 +92,26 @@ class BackendMetadataProvider:
 
     def _backend_exists(self, metadata_name: str) -> bool:
         """Check if a backend with the given metadata name exists."""
-        # Check statevector backends
-        if self._is_statevector_backend(metadata_name):
-            return True
+        return self._is_statevector_backend(metadata_name) or metadata_name in self._fake_backends
+
+    def all_backend_names(self) -> frozenset[str]:
+        """
+        Get every virtual backend name ('metadata@executor').
 
-        # Check FakeProvider backends
-        try:
-            self.provider.backend(metadata_name)
-            return True
-        except Exception:
-            return False
+        Returns:
+            Frozen set of all valid virtual backend names.
+
+        Examples:
+            >>> provider = BackendMetadataProvider(["aer"])
+            >>> "fake_manila@aer" in provider.all_backend_names()
+            True
+        """
+        metadata_names = [*self._fake_backends, *STATEVECTOR_BACKEND_NAMES]
+        return frozenset(
+            f"{metadata_name}@{executor_name}"
+            for metadata_name in metadata_names
+            for executor_name in self.available_executors
+        )
 
     def parse_backend_name(self, backend_name: str) -> tuple[str, str] | None:
         """
@@ -105,18 +132,23 @@ class BackendMetadataProvider:
             >>> provider.parse_backend_name("fake_manila@unknown")
             None
         """
-        if "@" not in backend_name:
-            return None
+        parsed = self._parsed_names.get(backend_name)
+        if parsed is not None:
+            return parsed
 
-        metadata_name, executor_name = backend_name.split("@", 1)
+        metadata_name, sep, executor_name = backend_name.partition("@")
+        if not sep:
+            return None
 
-        if executor_name not in self.available_executors:
+        if executor_name not in self._executor_set:
             return None
 
         if not self._backend_exists(metadata_name):
             return None
 
-        return (metadata_name, executor_name)
+        parsed = (metadata_name, executor_name)
+        self._parsed_names[backend_name] = parsed
+        return parsed
 
     def get_backend(self, metadata_name: str) -> Any:
         """
@@ -141,15 +173,14 @@ class BackendMetadataProvider:
             'statevector_simulator'
         """
         if self._is_statevector_backend(metadata_name):
-            # Return statevector backend with custom name
-            # Note: GenericBackendV2 doesn't have a good copy mechanism,
-            # so we'll just set the name directly (it's a simple attribute)
-            backend = self._statevector_backend
-            backend._name = metadata_name
-            return backend
+            # Return statevector backend (named once at creation)
+            return self._statevector_backend
         else:
             # Return FakeProvider backend
-            return self.provider.backend(metadata_name)
+            backend = self._fake_backends.get(metadata_name)
+            if backend is None:
+                raise ValueError(f"Backend not found: {metadata_name}")
+            return backend
 
     def _backend_to_dict(self, backend: Any, metadata_name: str | None = None) -> dict[str, Any]:
         """
@@ -189,10 +220,6 @@ class BackendMetadataProvider:
                 "description": getattr(backend, "description", ""),
             }
 
-            # Add basis gates
-            if hasattr(backend, "operation_names"):
-                result["supported_instructions"] = list(backend.operation_names)
-
         # Ensure operational status (server-side property, not in backend metadata)
         result["operational"] = True
 
@@ -200,9 +227,11 @@ class BackendMetadataProvider:
         if "max_experiments" not in result:
             result["max_experiments"] = 300
 
-        # Add supported_instructions if not present
-        if "supported_instructions" not in result and hasattr(backend, "operation_names"):
-            result["supported_instructions"] = list(backend.operation_names)
+        # Add supported_instructions (basis gates) if not present
+        if "supported_instructions" not in result:
+            operation_names = getattr(backend, "operation_names", None)
+            if operation_names is not None:
+                result["supported_instructions"] = list(operation_names)
 
         return result
 
@@ -231,22 +260,25 @@ class BackendMetadataProvider:
         """
         virtual_backends = []
 
+        # Each backend is converted once and shallow-copied per executor; only
+        # top-level keys differ between executors, so nested data is shared.
+
         # 1. Add FakeProvider backends
-        base_backends = self.provider.backends()
-        for backend in base_backends:
+        for backend in self._fake_backends.values():
+            base_dict = self._backend_to_dict(backend)
             for executor_name in self.available_executors:
                 virtual_name = f"{backend.name}@{executor_name}"
-                backend_dict = self._backend_to_dict(backend)
+                backend_dict = dict(base_dict)
                 backend_dict["name"] = virtual_name
                 backend_dict["backend_name"] = virtual_name
                 virtual_backends.append(backend_dict)
 
         # 2. Add Statevector backends
         for statevector_name in STATEVECTOR_BACKEND_NAMES:
-            backend = self.get_backend(statevector_name)
+            base_dict = self._backend_to_dict(self.get_backend(statevector_name))
             for executor_name in self.available_executors:
                 virtual_name = f"{statevector_name}@{executor_name}"
-                backend_dict = self._backend_to_dict(backend)
+                backend_dict = dict(base_dict)
                 backend_dict["name"] = virtual_name
                 backend_dict["backend_name"] = virtual_name
                 # Override description to clarify it's a statevector simulator
@@ -255,7 +287,9 @@ class BackendMetadataProvider:
                 )
                 virtual_backends.append(backend_dict)
 
-        return BackendsResponse(devices=virtual_backends)
+        # The list is built here with a known shape, so skip re-validating (and
+        # copying) every device dict
+        return BackendsResponse.model_construct(devices=virtual_backends)
 
 
 # Global singleton instance
@@ -2,6 +2,7 @@
 
 import json
 import time
+from datetime import timedelta
 
 import pytest
 from fastapi.testclient import TestClient
@@ -22,6 +23,30 @@ class TestCreateApp:
         assert app is not None
         assert app.title == "Qiskit Runtime Backend API"
 
+    def test_startup_warms_up_executors(self) -> None:
+        """Test that app startup runs warmup jobs on each executor."""
+        executor = AerExecutor()
+        app = create_app(executors={"aer": executor})
+
+        with TestClient(app):
+            assert executor._sampler is not None
+            assert executor._estimator is not None
+
+    def test_create_app_job_retention(self) -> None:
+        """Test that job retention settings are passed to the JobManager."""
+        app = create_app(
+            executors={"aer": AerExecutor()},
+            max_finished_jobs=5,
+            finished_job_ttl=60.0,
+            circuit_cache_size=4,
+        )
+
+        job_manager = app.state.job_manager
+        assert job_manager.max_finished_jobs == 5
+        assert job_manager.finished_job_ttl == 60.0
+        assert job_manager.circuit_cache_size == 4
+        job_manager.shutdown()
+
     def test_create_app_with_executors(self) -> None:
         """Test creating app with custom executors."""
         executors: dict[str, BaseExecutor] = {"aer": AerExecutor()}
@@ -66,6 +91,76 @@ class TestBackendsEndpoint:
         assert all(name.endswith("@aer") for name in backend_names)
         assert any("fake_manila@aer" in name for name in backend_names)
 
+    def test_list_backends_etag(self) -> None:
+        """Test that GET /v1/backends with a matching If-None-Match returns 304."""
+        app = create_app(executors={"aer": AerExecutor()})
+        client = TestClient(app)
+
+        response = client.get("/v1/backends")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "public, max-age=300"
+
+        response = client.get("/v1/backends", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+        for if_none_match in ("*", f'"stale", {etag}', f"W/{etag}"):
+            response = client.get("/v1/backends", headers={"If-None-Match": if_none_match})
+            assert response.status_code == 304
+
+        # fields is not implemented, so it does not change the payload
+        response = client.get("/v1/backends?fields=wait_time_seconds")
+        assert response.headers["etag"] == etag
+
+        response = client.get("/v1/backends", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert "devices" in response.json()
+
+    def test_get_backend_configuration(self) -> None:
+        """Test GET /v1/backends/{backend_name}/configuration."""
+        app = create_app(executors={"aer": AerExecutor()})
+        client = TestClient(app)
+
+        response = client.get("/v1/backends/fake_manila@aer/configuration")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+
+        data = response.json()
+        assert data["backend_name"] == "fake_manila@aer"
+        assert data["n_qubits"] == 5
+
+        response = client.get("/v1/backends/fake_unknown@aer/configuration")
+        assert response.status_code == 404
+
+    def test_backend_metadata_is_cached(self) -> None:
+        """Test that backend metadata responses are served from cache."""
+        app = create_app(executors={"aer": AerExecutor()})
+        client = TestClient(app)
+
+        first = client.get("/v1/backends/fake_manila@aer/configuration")
+        second = client.get("/v1/backends/fake_manila@aer/configuration")
+        assert first.content == second.content
+        assert second.headers["cache-control"] == "public, max-age=300"
+
+        # Errors are not cached
+        response = client.get("/v1/backends/fake_unknown@aer/configuration")
+        assert response.status_code == 404
+        assert "cache-control" not in response.headers
+
+    def test_get_backend_properties(self) -> None:
+        """Test GET /v1/backends/{backend_name}/properties."""
+        app = create_app(executors={"aer": AerExecutor()})
+        client = TestClient(app)
+
+        response = client.get("/v1/backends/fake_manila@aer/properties")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["backend_name"] == "fake_manila@aer"
+        # datetime fields are serialized as ISO 8601 strings
+        assert isinstance(data["last_update_date"], str)
+
     def test_get_backend_status(self) -> None:
         """Test GET /v1/backends/{backend_name}/status."""
         app = create_app(executors={"aer": AerExecutor()})
@@ -248,11 +343,139 @@ class TestJobsEndpoint:
         assert "state" in data
         assert data["state"]["status"] in [JobStatus.QUEUED, JobStatus.RUNNING, JobStatus.COMPLETED]
 
+    def test_get_job_status_etag(self, client: TestClient, simple_circuit: QuantumCircuit) -> None:
+        """Test that polling with If-None-Match returns 304 until the job changes."""
+        pubs_data = [(simple_circuit,)]
+        serialized_params = json.loads(json.dumps({"pubs": pubs_data}, cls=RuntimeEncoder))
+
+        response = client.post(
+            "/v1/jobs",
+            json={
+                "program_id": "sampler",
+                "backend": "fake_manila@aer",
+                "params": serialized_params,
+                "options": {},
+            },
+        )
+        job_id = response.json()["id"]
+
+        # Wait for a terminal state so the status no longer changes
+        for _ in range(10):
+            response = client.get(f"/v1/jobs/{job_id}")
+            if response.json()["state"]["status"] in [JobStatus.COMPLETED, JobStatus.FAILED]:
+                break
+            time.sleep(1)
+
+        # Finished jobs no longer need polling
+        assert response.json()["suggested_poll_interval_ms"] == 0
+        assert "retry-after" not in response.headers
+
+        etag = response.headers["etag"]
+        response = client.get(f"/v1/jobs/{job_id}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+        response = client.get(f"/v1/jobs/{job_id}", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.json()["id"] == job_id
+
+        # ETag lists and weak validators are matched as well
+        response = client.get(f"/v1/jobs/{job_id}", headers={"If-None-Match": f'"stale", W/{etag}'})
+        assert response.status_code == 304
+
+    def test_get_job_status_poll_hint(self) -> None:
+        """Test that unfinished jobs get a bounded poll interval and Retry-After."""
+        app = create_app(executors={"aer": AerExecutor()})
+        job_manager = app.state.job_manager
+        # Stop the worker so the job stays QUEUED
+        job_manager.shutdown()
+
+        with TestClient(app) as client:
+            job_id = job_manager.create_job(
+                program_id="sampler",
+                backend_name="fake_manila@aer",
+                params={"pubs": []},
+                options={},
+            )
+
+            response = client.get(f"/v1/jobs/{job_id}")
+            assert response.status_code == 200
+            assert response.json()["state"]["status"] == JobStatus.QUEUED
+            assert response.json()["suggested_poll_interval_ms"] == 200
+            assert response.headers["retry-after"] == "1"
+
+            # Jobs waiting longer are polled less often, up to the cap
+            job_manager.get_job(job_id).created_at -= timedelta(hours=1)
+            response = client.get(f"/v1/jobs/{job_id}")
+            assert response.json()["suggested_poll_interval_ms"] == 5000
+            assert response.headers["retry-after"] == "5"
+
+    def test_get_job_status_long_poll(
+        self, client: TestClient, simple_circuit: QuantumCircuit
+    ) -> None:
+        """Test that ?wait holds the request until the job changes status."""
+        pubs_data = [(simple_circuit,)]
+        serialized_params = json.loads(json.dumps({"pubs": pubs_data}, cls=RuntimeEncoder))
+
+        response = client.post(
+            "/v1/jobs",
+            json={
+                "program_id": "sampler",
+                "backend": "fake_manila@aer",
+                "params": serialized_params,
+                "options": {},
+            },
+        )
+        job_id = response.json()["id"]
+
+        # Either the job was QUEUED and has since started, or it was already
+        # RUNNING/finished; in no case is QUEUED returned after waiting
+        response = client.get(f"/v1/jobs/{job_id}", params={"wait": 30})
+        assert response.status_code == 200
+        assert response.json()["state"]["status"] != JobStatus.QUEUED
+
+        response = client.get(f"/v1/jobs/{job_id}", params={"wait": 1000})
+        assert response.status_code == 422
+
     def test_get_job_status_not_found(self, client: TestClient) -> None:
         """Test getting status of non-existent job."""
         response = client.get("/v1/jobs/non-existent-job")
         assert response.status_code == 404
 
+    def test_get_job_statuses_batch(
+        self, client: TestClient, simple_circuit: QuantumCircuit
+    ) -> None:
+        """Test POST /v1/jobs:batchStatus."""
+        pubs_data = [(simple_circuit,)]
+        serialized_params = json.loads(json.dumps({"pubs": pubs_data}, cls=RuntimeEncoder))
+
+        job_ids = []
+        for _ in range(2):
+            response = client.post(
+                "/v1/jobs",
+                json={
+                    "program_id": "sampler",
+                    "backend": "fake_manila@aer",
+                    "params": serialized_params,
+                    "options": {},
+                },
+            )
+            assert response.status_code == 202
+            job_ids.append(response.json()["id"])
+
+        response = client.post("/v1/jobs:batchStatus", json={"ids": [*job_ids, "non-existent-job"]})
+        assert response.status_code == 200
+
+        jobs = response.json()["jobs"]
+        assert [job["id"] for job in jobs] == job_ids
+        for job in jobs:
+            assert job["state"]["status"] in [
+                JobStatus.QUEUED,
+                JobStatus.RUNNING,
+                JobStatus.COMPLETED,
+            ]
+
     def test_get_job_results_success(
         self, client: TestClient, simple_circuit: QuantumCircuit
     ) -> None:
@@ -295,6 +518,9 @@ class TestJobsEndpoint:
         # or pub_results and metadata fields
         assert "__type__" in data or "pub_results" in data
 
+        # Repeated fetches return the cached encoding
+        assert client.get(f"/v1/jobs/{job_id}/results").content == response.content
+
     def test_get_job_results_not_completed(self, client: TestClient) -> None:
         """Test GET /v1/jobs/{job_id}/results returns 400 for non-completed job."""
         # Create a simple circuit
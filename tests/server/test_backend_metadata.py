@@ -1,5 +1,6 @@
 """Tests for BackendMetadataProvider."""
 
+import pytest
 from qiskit_ibm_runtime.fake_provider import FakeProviderForBackendV2
 
 from qiskit_runtime_server.providers.backend_metadata import (
@@ -44,6 +45,25 @@ class TestParseBackendName:
         result = provider.parse_backend_name("fake_unknown@aer")
         assert result is None
 
+    def test_all_backend_names(self) -> None:
+        """Test that all virtual backend names match list_backends()."""
+        provider = BackendMetadataProvider(available_executors=["aer", "custatevec"])
+
+        names = provider.all_backend_names()
+        listed = {b["backend_name"] for b in provider.list_backends().devices}
+        assert names == listed
+        assert "statevector_simulator@custatevec" in names
+
+    def test_parse_backend_name_is_memoized(self) -> None:
+        """Test that valid names are parsed once and invalid names are not cached."""
+        provider = BackendMetadataProvider(available_executors=["aer"])
+
+        first = provider.parse_backend_name("fake_manila@aer")
+        assert provider.parse_backend_name("fake_manila@aer") is first
+
+        assert provider.parse_backend_name("fake_unknown@aer") is None
+        assert "fake_unknown@aer" not in provider._parsed_names
+
 
 class TestListBackends:
     """Tests for list_backends() method."""
@@ -172,6 +192,14 @@ class TestStatevectorBackend:
         backend = provider.get_backend("fake_manila")
         assert backend is not None
         assert backend.name == "fake_manila"
+        # The same instance is returned on every look-up
+        assert provider.get_backend("fake_manila") is backend
+
+    def test_get_unknown_backend(self) -> None:
+        """Test that an unknown metadata name raises ValueError."""
+        provider = BackendMetadataProvider(available_executors=["aer"])
+        with pytest.raises(ValueError, match="fake_unknown"):
+            provider.get_backend("fake_unknown")
 
     def test_parse_statevector_backend_name(self) -> None:
         """Test parsing statevector backend name."""
@@ -1,9 +1,18 @@
 """Tests for executor implementations."""
 
+from unittest.mock import MagicMock
+
+import pytest
 from qiskit import QuantumCircuit
+from qiskit.primitives import PrimitiveResult
 from qiskit.quantum_info import SparsePauliOp
 
-from qiskit_runtime_server.executors import AerExecutor, BaseExecutor
+from qiskit_runtime_server.executors import (
+    AerExecutor,
+    BaseExecutor,
+    CuStateVecExecutor,
+    custatevec,
+)
 
 
 class TestAerExecutor:
@@ -120,6 +129,25 @@ class TestAerExecutor:
         # Results should be identical
         assert result1[0].data.meas.get_counts() == result2[0].data.meas.get_counts()
 
+    def test_simulator_reused_across_jobs(self) -> None:
+        """Test that the simulator and primitives are created once per executor."""
+        executor = AerExecutor(seed_simulator=42)
+
+        circuit = QuantumCircuit(1)
+        circuit.h(0)
+        circuit.measure_all()
+        pubs = [(circuit,)]
+        options = {"default_shots": 1024}
+
+        result1 = executor.execute_sampler(pubs=pubs, options=options, backend_name="fake_manila")
+        sampler = executor._sampler
+        result2 = executor.execute_sampler(pubs=pubs, options=options, backend_name="fake_manila")
+
+        assert sampler is not None
+        assert executor._sampler is sampler
+        # Seeded results stay reproducible on the shared simulator
+        assert result1[0].data.meas.get_counts() == result2[0].data.meas.get_counts()
+
     def test_options_shots_override(self) -> None:
         """Test that options default_shots overrides executor default."""
         executor = AerExecutor(shots=1024)
@@ -158,6 +186,66 @@ class TestAerExecutorOptions:
         assert result is not None
         assert len(result) == 1
 
+    def test_single_precision_option(self) -> None:
+        """Test that precision="single" is passed to the simulator."""
+        executor = AerExecutor(precision="single")
+
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+
+        result = executor.execute_estimator(
+            pubs=[(circuit, SparsePauliOp(["ZZ"]))], options={}, backend_name="fake_manila"
+        )
+
+        assert executor._get_simulator().options.precision == "single"
+        assert abs(float(result[0].data.evs) - 1.0) < 1e-6
+
+    def test_max_experiments_splits_pubs(self) -> None:
+        """Test that max_experiments runs PUBs in chunks and keeps their order."""
+        executor = AerExecutor(max_experiments=2)
+
+        pubs = []
+        for num_qubits in range(1, 6):
+            circuit = QuantumCircuit(num_qubits)
+            circuit.x(range(num_qubits))
+            circuit.measure_all()
+            pubs.append((circuit, None, 10))
+
+        result = executor.execute_sampler(pubs=pubs, options={}, backend_name="fake_manila")
+
+        assert len(result) == 5
+        for num_qubits, pub_result in enumerate(result, start=1):
+            assert pub_result.data.meas.get_counts() == {"1" * num_qubits: 10}
+        assert result.metadata == {"version": 2}
+
+    def test_max_experiments_keeps_first_chunk_metadata(self) -> None:
+        """Test that chunked runs keep the first chunk's top-level metadata."""
+        executor = AerExecutor(max_experiments=2)
+
+        primitive = MagicMock()
+        primitive.run.return_value.result.side_effect = [
+            PrimitiveResult([pub_result], metadata={"version": 2, "chunk": index})
+            for index, pub_result in enumerate(["a", "b", "c"])
+        ]
+
+        result = executor._run_primitive(primitive, ["pub"] * 5, executor.max_experiments)
+
+        assert primitive.run.call_count == 3
+        assert list(result) == ["a", "b", "c"]
+        assert result.metadata == {"version": 2, "chunk": 0}
+
+    @pytest.mark.parametrize("max_experiments", [0, -1])
+    def test_max_experiments_must_be_positive(self, max_experiments: int) -> None:
+        """Test that a max_experiments below 1 is rejected at construction."""
+        with pytest.raises(ValueError, match="max_experiments"):
+            AerExecutor(max_experiments=max_experiments)
+
+    def test_invalid_precision(self) -> None:
+        """Test that an unknown precision is rejected at construction."""
+        with pytest.raises(ValueError, match="precision"):
+            AerExecutor(precision="fp32")  # type: ignore[arg-type]
+
     def test_estimator_with_precision(self) -> None:
         """Test estimator with explicit precision option."""
         executor = AerExecutor()
@@ -195,3 +283,40 @@ class TestAerExecutorOptions:
 
         assert result is not None
         assert len(result) == 1
+
+
+class TestCuStateVecExecutorOptions:
+    """Tests for CuStateVecExecutor option handling (no GPU required)."""
+
+    @pytest.fixture
+    def simulator_cls(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Stand in for cusvaer's StatevectorSimulator."""
+        simulator_cls = MagicMock()
+        monkeypatch.setattr(custatevec, "CUSTATEVEC_AVAILABLE", True)
+        monkeypatch.setattr(custatevec, "StatevectorSimulator", simulator_cls, raising=False)
+        return simulator_cls
+
+    def test_simulator_options(self, simulator_cls: MagicMock) -> None:
+        """Test that fusion_max_qubits and precision are passed to the simulator."""
+        executor = CuStateVecExecutor(fusion_max_qubits=4, precision="single")
+
+        assert executor._get_simulator() is simulator_cls.return_value
+        simulator_cls.assert_called_once_with(precision="single", fusion_max_qubit=4)
+
+    def test_default_simulator_options(self, simulator_cls: MagicMock) -> None:
+        """Test that simulator defaults are left alone when options are not set."""
+        CuStateVecExecutor()._create_simulator()
+
+        simulator_cls.assert_called_once_with()
+
+    @pytest.mark.usefixtures("simulator_cls")
+    def test_invalid_precision(self) -> None:
+        """Test that an unknown precision is rejected at construction."""
+        with pytest.raises(ValueError, match="precision"):
+            CuStateVecExecutor(precision="fp32")  # type: ignore[arg-type]
+
+    @pytest.mark.usefixtures("simulator_cls")
+    def test_fusion_max_qubits_must_be_positive(self) -> None:
+        """Test that a fusion_max_qubits below 1 is rejected at construction."""
+        with pytest.raises(ValueError, match="fusion_max_qubits"):
+            CuStateVecExecutor(fusion_max_qubits=0)
@@ -3,6 +3,7 @@
 import json
 import time
 from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
 
 import pytest
 from qiskit import QuantumCircuit
@@ -222,6 +223,50 @@ class TestJobManagerQueue:
         # Cleanup
         manager.shutdown()
 
+    def test_executors_run_in_parallel(self) -> None:
+        """Test that a busy executor does not block jobs on another executor."""
+        import threading
+
+        from qiskit_runtime_server.providers.backend_metadata import BackendMetadataProvider
+
+        release = threading.Event()
+
+        class BlockingExecutor(AerExecutor):
+            @property
+            def name(self) -> str:
+                return "blocking"
+
+            def execute_sampler(self, pubs: Any, options: Any, backend_name: str) -> Any:
+                release.wait(timeout=30)
+                return super().execute_sampler(pubs, options, backend_name)
+
+        executors: dict[str, BaseExecutor] = {"aer": AerExecutor(), "blocking": BlockingExecutor()}
+        manager = JobManager(executors=executors)
+        manager._metadata_provider = BackendMetadataProvider(list(executors))
+
+        circuit = QuantumCircuit(1)
+        circuit.measure_all()
+        params = serialize_params({"pubs": [(circuit,)]})
+
+        try:
+            blocked_id = manager.create_job("sampler", "fake_manila@blocking", params, {})
+            aer_id = manager.create_job("sampler", "fake_manila@aer", params, {})
+
+            for _ in range(100):
+                job = manager.get_job(aer_id)
+                assert job is not None
+                if job.status == JobStatus.COMPLETED:
+                    break
+                time.sleep(0.1)
+
+            aer_job = manager.get_job(aer_id)
+            blocked_job = manager.get_job(blocked_id)
+            assert aer_job is not None and aer_job.status == JobStatus.COMPLETED
+            assert blocked_job is not None and blocked_job.status == JobStatus.RUNNING
+        finally:
+            release.set()
+            manager.shutdown()
+
 
 class TestJobManagerShutdown:
     """Tests for job manager shutdown functionality."""
@@ -231,14 +276,16 @@ class TestJobManagerShutdown:
         manager = JobManager(executors={"aer": AerExecutor()})
 
         # Verify worker is running
-        assert manager._worker_thread is not None
-        assert manager._worker_thread.is_alive()
+        worker_thread = manager._worker_threads["aer"]
+        assert worker_thread.is_alive()
 
-        # Shutdown
+        # Shutdown wakes the idle worker instead of waiting for a poll timeout
+        start = time.monotonic()
         manager.shutdown()
+        assert time.monotonic() - start < 1.0
 
         # Worker should be stopped
-        assert not manager._worker_thread.is_alive()
+        assert not worker_thread.is_alive()
 
     def test_shutdown_with_pending_jobs(self) -> None:
         """Test shutdown with jobs still in queue."""
@@ -263,8 +310,7 @@ class TestJobManagerShutdown:
         manager.shutdown()
 
         # Worker should be stopped
-        assert manager._worker_thread is not None
-        assert not manager._worker_thread.is_alive()
+        assert not manager._worker_threads["aer"].is_alive()
 
         # Check job states (some might be completed, some queued)
         for job_id in job_ids:
@@ -406,6 +452,221 @@ class TestJobManagerEdgeCases:
         # Cleanup
         manager.shutdown()
 
+    def test_status_listener_notified(self) -> None:
+        """Test that status listeners run on each status change."""
+        manager = JobManager(executors={"aer": AerExecutor()})
+
+        circuit = QuantumCircuit(1)
+        circuit.measure_all()
+
+        # Stop the worker so the job stays QUEUED until cancelled
+        manager.shutdown()
+        job_id = manager.create_job(
+            program_id="sampler",
+            backend_name="fake_manila@aer",
+            params=serialize_params({"pubs": [(circuit,)]}),
+            options={},
+        )
+
+        seen: list[JobStatus] = []
+
+        def listener() -> None:
+            job = manager.get_job(job_id)
+            assert job is not None
+            seen.append(job.status)
+
+        manager.add_status_listener(job_id, listener)
+        assert manager.cancel_job(job_id)
+        assert seen == [JobStatus.CANCELLED]
+
+        manager.remove_status_listener(job_id, listener)
+        assert manager._status_listeners == {}
+
+    def test_finished_jobs_evicted(self) -> None:
+        """Test that finished jobs are evicted by count and by age."""
+        manager = JobManager(executors={"aer": AerExecutor()}, max_finished_jobs=1)
+
+        circuit = QuantumCircuit(1)
+        circuit.measure_all()
+        params = serialize_params({"pubs": [(circuit,)]})
+
+        # Stop the worker so jobs stay QUEUED until cancelled
+        manager.shutdown()
+        job_ids = [
+            manager.create_job(
+                program_id="sampler",
+                backend_name="fake_manila@aer",
+                params=params,
+                options={},
+            )
+            for _ in range(3)
+        ]
+
+        assert manager.cancel_job(job_ids[0])
+        assert manager.cancel_job(job_ids[1])
+
+        # Only the most recently finished job is kept; queued jobs are untouched
+        assert manager.get_job(job_ids[0]) is None
+        assert manager.get_job(job_ids[1]) is not None
+        assert manager.get_job(job_ids[2]) is not None
+
+        # A zero TTL evicts finished jobs right away
+        manager.finished_job_ttl = 0.0
+        assert manager.cancel_job(job_ids[2])
+        assert manager.get_job(job_ids[1]) is None
+        assert manager.get_job(job_ids[2]) is None
+
+    def test_deserialize_params_matches_runtime_decoder(self) -> None:
+        """Test that params decode the same as json.loads with RuntimeDecoder."""
+        import numpy as np
+        from qiskit.circuit import Parameter
+        from qiskit.quantum_info import SparsePauliOp
+        from qiskit_ibm_runtime.utils import RuntimeDecoder
+
+        manager = JobManager(executors={"aer": AerExecutor()})
+
+        theta = Parameter("theta")
+        circuit = QuantumCircuit(2)
+        circuit.ry(theta, 0)
+        circuit.cx(0, 1)
+        observable = SparsePauliOp(["ZZ", "XI"], coeffs=[1.0, 0.5j])
+        params = serialize_params(
+            {"pubs": [(circuit, observable, np.array([[0.1], [0.2]]), 0.01)], "version": 2}
+        )
+        original = json.loads(json.dumps(params))
+
+        decoded = manager._deserialize_params(params)
+        expected = json.loads(json.dumps(params), cls=RuntimeDecoder)
+
+        (pub,) = decoded["pubs"]
+        (expected_pub,) = expected["pubs"]
+        assert pub[0] == expected_pub[0]
+        assert pub[1] == expected_pub[1]
+        assert np.array_equal(pub[2], expected_pub[2])
+        assert pub[3] == expected_pub[3]
+        assert decoded["version"] == 2
+        # The stored params are not modified
+        assert params == original
+
+        manager.shutdown()
+
+    def test_queue_length_and_session_cancellation(self) -> None:
+        """Test queue length and session cancellation as jobs change state."""
+        manager = JobManager(executors={"aer": AerExecutor()})
+
+        circuit = QuantumCircuit(1)
+        circuit.measure_all()
+        params = serialize_params({"pubs": [(circuit,)]})
+
+        # Stop the worker so jobs stay QUEUED until cancelled
+        manager.shutdown()
+        session_job_ids = [
+            manager.create_job("sampler", "fake_manila@aer", params, {}, session_id="session-1")
+            for _ in range(2)
+        ]
+        other_job_id = manager.create_job("sampler", "fake_manila@aer", params, {})
+
+        assert manager.get_queue_length("aer") == 3
+        assert manager.get_queue_length() == 3
+        assert manager.get_queue_length("custatevec") == 0
+
+        assert manager.cancel_session_jobs("session-1") == 2
+        for job_id in session_job_ids:
+            job = manager.get_job(job_id)
+            assert job is not None
+            assert job.status == JobStatus.CANCELLED
+        assert manager.get_queue_length("aer") == 1
+
+        # Already-cancelled session jobs are not counted again
+        assert manager.cancel_session_jobs("session-1") == 0
+
+        assert manager.cancel_job(other_job_id)
+        assert manager.get_queue_length() == 0
+
+    def test_session_cancelled_while_job_is_created(self) -> None:
+        """Test that a session cancelled during create_job still cancels the new job."""
+        session_manager = MagicMock()
+        session_manager.get_session.return_value.accepting_jobs = True
+        session_manager.validate_job_backend.return_value = True
+        manager = JobManager(executors={"aer": AerExecutor()}, session_manager=session_manager)
+        manager.shutdown()
+
+        # Cancel the session between storing the job and adding it to the session
+        session_manager.add_job_to_session.side_effect = lambda session_id, _job_id: (
+            manager.cancel_session_jobs(session_id) == 1
+        )
+
+        circuit = QuantumCircuit(1)
+        circuit.measure_all()
+        params = serialize_params({"pubs": [(circuit,)]})
+        job_id = manager.create_job("sampler", "fake_manila@aer", params, {}, session_id="s-1")
+
+        job = manager.get_job(job_id)
+        assert job is not None
+        assert job.status == JobStatus.CANCELLED
+        assert manager.get_queue_length() == 0
+
+        # A job that cannot join its session is removed from every index
+        session_manager.add_job_to_session.side_effect = None
+        session_manager.add_job_to_session.return_value = False
+        with pytest.raises(ValueError, match="Failed to add job to session"):
+            manager.create_job("sampler", "fake_manila@aer", params, {}, session_id="s-1")
+        assert manager.get_queue_length() == 0
+        assert "s-1" not in manager._queued_session_jobs
+
+    def test_decoded_circuits_are_cached(self) -> None:
+        """Test that repeated circuits are decoded once and never shared between jobs."""
+        manager = JobManager(executors={"aer": AerExecutor()}, circuit_cache_size=1)
+
+        bell = QuantumCircuit(2)
+        bell.h(0)
+        bell.cx(0, 1)
+        bell.measure_all()
+        ghz = QuantumCircuit(3)
+        ghz.h(0)
+        ghz.cx(0, 1)
+        ghz.cx(1, 2)
+        ghz.measure_all()
+
+        bell_params = serialize_params({"pubs": [(bell,)]})
+        first = manager._deserialize_params(bell_params)["pubs"][0][0]
+        second = manager._deserialize_params(bell_params)["pubs"][0][0]
+
+        assert first == bell
+        assert second == bell
+        assert first is not second
+        assert len(manager._circuit_cache) == 1
+
+        # The least recently used circuit is evicted once the cache is full
+        assert (
+            manager._deserialize_params(serialize_params({"pubs": [(ghz,)]}))["pubs"][0][0] == ghz
+        )
+        assert len(manager._circuit_cache) == 1
+        (cached,) = manager._circuit_cache.values()
+        assert cached == ghz
+
+        manager.shutdown()
+
+    def test_get_jobs_skips_unknown_ids(self) -> None:
+        """Test that get_jobs returns only the jobs that exist."""
+        manager = JobManager(executors={"aer": AerExecutor()})
+
+        circuit = QuantumCircuit(1)
+        circuit.measure_all()
+        job_id = manager.create_job(
+            program_id="sampler",
+            backend_name="fake_manila@aer",
+            params=serialize_params({"pubs": [(circuit,)]}),
+            options={},
+        )
+
+        jobs = manager.get_jobs([job_id, "nonexistent-job-id"])
+        assert list(jobs) == [job_id]
+        assert jobs[job_id].job_id == job_id
+
+        # Cleanup
+        manager.shutdown()
+
     def test_invalid_backend_executor_not_found(self) -> None:
         """Test that executor not found during execution causes job failure."""
         from datetime import UTC, datetime
@@ -1,9 +1,13 @@
 """Tests for session management endpoints."""
 
+import time
+
 import pytest
 from fastapi.testclient import TestClient
 
 from qiskit_runtime_server.app import create_app
+from qiskit_runtime_server.managers import SessionManager
+from qiskit_runtime_server.models import SessionMode
 
 
 @pytest.fixture
@@ -351,3 +355,27 @@ class TestSessionJobIntegration:
 
         assert job_response.status_code == 404
         assert "not accepting" in job_response.json()["detail"].lower()
+
+
+class TestSessionManager:
+    """Tests for SessionManager internals."""
+
+    def test_cleanup_expired_sessions(self) -> None:
+        """Test that expired sessions are removed without mutating earlier snapshots."""
+        manager = SessionManager()
+        expired_id = manager.create_session(SessionMode.BATCH, "fake_manila@aer", max_ttl=0)
+        active_id = manager.create_session(SessionMode.DEDICATED, "fake_manila@aer")
+        snapshot = manager.sessions
+
+        time.sleep(0.01)
+        assert manager.cleanup_expired_sessions() == 1
+
+        assert manager.get_session(expired_id) is None
+        assert manager.get_session_mode(active_id) == SessionMode.DEDICATED
+        assert list(manager.list_sessions()) == [active_id]
+        # Readers holding the previous dict still see a consistent view
+        assert set(snapshot) == {expired_id, active_id}
+
+        # Only the unexpired session is left to track
+        assert len(manager._expiry_heap) == 1
+        assert manager.cleanup_expired_sessions() == 0